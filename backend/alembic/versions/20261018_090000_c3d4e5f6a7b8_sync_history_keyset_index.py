@@ -0,0 +1,68 @@
+"""sync_history_keyset_index
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6g7
+Create Date: 2026-10-18 09:00:00
+
+Replace the single-column started_at index on sync_history with a composite
+(started_at DESC, id DESC) covering index that INCLUDEs the columns read by
+/status and /history, so keyset pagination on /data-sync/history is an
+index-only seek.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d4e5f6a7b8'
+down_revision: Union[str, Sequence[str], None] = 'b2c3d4e5f6g7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COVERING_COLUMNS = [
+    'status',
+    'sync_type',
+    'completed_at',
+    'duration_seconds',
+    'records_downloaded',
+    'records_imported',
+    'records_classified',
+]
+
+
+def upgrade() -> None:
+    """Create covering (started_at, id) index for keyset pagination."""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_sync_history_started_at_covering',
+            'sync_history',
+            ['started_at', 'id'],
+            postgresql_ops={'started_at': 'DESC', 'id': 'DESC'},
+            postgresql_include=COVERING_COLUMNS,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_sync_history_started_at',
+            table_name='sync_history',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore single-column started_at index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_sync_history_started_at',
+            'sync_history',
+            ['started_at'],
+            postgresql_ops={'started_at': 'DESC'},
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_sync_history_started_at_covering',
+            table_name='sync_history',
+            postgresql_concurrently=True,
+        )
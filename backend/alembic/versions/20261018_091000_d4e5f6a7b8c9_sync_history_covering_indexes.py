@@ -0,0 +1,43 @@
+"""sync_history_covering_indexes
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-18 09:10:00
+
+Add a partial index over queued/running sync_history jobs for /active.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c9'
+down_revision: Union[str, Sequence[str], None] = 'c3d4e5f6a7b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create partial index over active sync_history jobs."""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_sync_history_active',
+            'sync_history',
+            ['started_at'],
+            postgresql_ops={'started_at': 'DESC'},
+            postgresql_where=sa.text("status IN ('queued', 'running')"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop partial index over active sync_history jobs."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_sync_history_active',
+            table_name='sync_history',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,41 @@
+"""asset_meta_type_code_index
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-18 09:20:00
+
+Add (asset_type, code) index on asset_meta so keyset pagination of a single
+asset type (e.g. /indices?cursor=...) is an index range scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, Sequence[str], None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create (asset_type, code) index."""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_asset_meta_type_code',
+            'asset_meta',
+            ['asset_type', 'code'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop (asset_type, code) index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_asset_meta_type_code',
+            table_name='asset_meta',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,52 @@
+"""index_industry_sw_l1_view
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-18 09:30:00
+
+Materialize index_profile.industry_composition->'sw_l1' as one
+(code, industry, weight) row per entry so /indices/by-industry is a btree
+range scan instead of JSONB extraction over every index profile.
+Refreshed by calculate_index_industry_composition.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, Sequence[str], None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create index_industry_sw_l1 materialized view and its indexes."""
+    op.execute("""
+        CREATE MATERIALIZED VIEW index_industry_sw_l1 AS
+        SELECT
+            p.code,
+            t.industry,
+            t.weight::double precision AS weight
+        FROM index_profile p,
+             jsonb_each_text(p.industry_composition->'sw_l1') AS t(industry, weight)
+        WHERE p.industry_composition ? 'sw_l1'
+        WITH DATA
+    """)
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        'idx_index_industry_sw_l1_code_industry',
+        'index_industry_sw_l1',
+        ['code', 'industry'],
+        unique=True,
+    )
+    op.execute(
+        "CREATE INDEX idx_index_industry_sw_l1_industry_weight "
+        "ON index_industry_sw_l1 (industry, weight DESC)"
+    )
+
+
+def downgrade() -> None:
+    """Drop index_industry_sw_l1 materialized view."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS index_industry_sw_l1")
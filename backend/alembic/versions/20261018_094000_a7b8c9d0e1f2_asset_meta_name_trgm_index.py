@@ -0,0 +1,44 @@
+"""asset_meta_name_trgm_index
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-18 09:40:00
+
+Enable pg_trgm and add a GIN trigram index on asset_meta.name so the pool
+evaluator's unanchored "like" filter no longer forces a sequential scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, Sequence[str], None] = 'f6a7b8c9d0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create pg_trgm extension and trigram index on asset_meta.name."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_asset_meta_name_trgm',
+            'asset_meta',
+            ['name'],
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop trigram index on asset_meta.name (extension is left installed)."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_asset_meta_name_trgm',
+            table_name='asset_meta',
+            postgresql_concurrently=True,
+        )
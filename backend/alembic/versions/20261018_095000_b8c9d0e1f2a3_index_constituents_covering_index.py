@@ -0,0 +1,46 @@
+"""index_constituents_covering_index
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-18 09:50:00
+
+Partial covering index over current (expire_date IS NULL) constituents,
+ordered by weight, so /indices/{code}/constituents reads them with an
+index-only scan and only touches asset_meta for the name lookup.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8c9d0e1f2a3'
+down_revision: Union[str, Sequence[str], None] = 'a7b8c9d0e1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create partial covering index on index_constituents."""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_constituents_current_weight',
+            'index_constituents',
+            ['index_code', 'weight'],
+            postgresql_ops={'weight': 'DESC'},
+            postgresql_include=['stock_code', 'effective_date'],
+            postgresql_where=sa.text('expire_date IS NULL'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop partial covering index on index_constituents."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_constituents_current_weight',
+            table_name='index_constituents',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,42 @@
+"""stock_pools_listing_index
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-18 10:00:00
+
+Add (is_system DESC, created_at DESC, id DESC) index on stock_pools so
+keyset pagination in /pools is an index range scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d0e1f2a3b4'
+down_revision: Union[str, Sequence[str], None] = 'b8c9d0e1f2a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create stock_pools listing index."""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_stock_pools_listing',
+            'stock_pools',
+            ['is_system', 'created_at', 'id'],
+            postgresql_ops={'is_system': 'DESC', 'created_at': 'DESC', 'id': 'DESC'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop stock_pools listing index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_stock_pools_listing',
+            table_name='stock_pools',
+            postgresql_concurrently=True,
+        )
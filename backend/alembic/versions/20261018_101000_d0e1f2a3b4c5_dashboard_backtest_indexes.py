@@ -0,0 +1,57 @@
+"""dashboard_backtest_indexes
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-18 10:10:00
+
+Indexes for the dashboard stats queries: (user_id, status) on
+backtest_jobs for the per-user status counts, and (status,
+total_return DESC) over non-null returns on backtest_results so the
+top-backtests ORDER BY ... LIMIT is an index range scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd0e1f2a3b4c5'
+down_revision: Union[str, Sequence[str], None] = 'c9d0e1f2a3b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create dashboard indexes on backtest_jobs and backtest_results."""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_backtest_jobs_user_status',
+            'backtest_jobs',
+            ['user_id', 'status'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_backtest_results_status_return',
+            'backtest_results',
+            ['status', 'total_return'],
+            postgresql_ops={'total_return': 'DESC'},
+            postgresql_where=sa.text('total_return IS NOT NULL'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop dashboard indexes."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_backtest_results_status_return',
+            table_name='backtest_results',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_backtest_jobs_user_status',
+            table_name='backtest_jobs',
+            postgresql_concurrently=True,
+        )
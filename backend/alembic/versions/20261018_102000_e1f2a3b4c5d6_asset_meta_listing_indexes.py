@@ -0,0 +1,56 @@
+"""asset_meta_listing_indexes
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-18 10:20:00
+
+Indexes for the /stocks listings: (asset_type, exchange, code) so the
+type/exchange filter is read in code order for LIMIT/OFFSET pages, and a
+trigram GIN index on code to pair with the existing one on name for the
+unanchored code-or-name search.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f2a3b4c5d6'
+down_revision: Union[str, Sequence[str], None] = 'd0e1f2a3b4c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create listing indexes on asset_meta."""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_asset_meta_type_exchange_code',
+            'asset_meta',
+            ['asset_type', 'exchange', 'code'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_asset_meta_code_trgm',
+            'asset_meta',
+            ['code'],
+            postgresql_using='gin',
+            postgresql_ops={'code': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop listing indexes on asset_meta."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_asset_meta_code_trgm',
+            table_name='asset_meta',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_asset_meta_type_exchange_code',
+            table_name='asset_meta',
+            postgresql_concurrently=True,
+        )
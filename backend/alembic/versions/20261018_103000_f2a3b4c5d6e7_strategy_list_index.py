@@ -0,0 +1,42 @@
+"""strategy_list_index
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-18 10:30:00
+
+(user_id, updated_at DESC) on strategies so the strategy list reads a
+user's newest strategies straight off the index instead of sorting them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a3b4c5d6e7'
+down_revision: Union[str, Sequence[str], None] = 'e1f2a3b4c5d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the strategy list index."""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_strategies_user_updated',
+            'strategies',
+            ['user_id', 'updated_at'],
+            postgresql_ops={'updated_at': 'DESC'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the strategy list index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_strategies_user_updated',
+            table_name='strategies',
+            postgresql_concurrently=True,
+        )
@@ -3,20 +3,26 @@
 Provides endpoints for monitoring and triggering data synchronization.
 """
 
-from datetime import datetime
-from typing import List, Optional
+import asyncio
+import base64
+import hashlib
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
-from sqlalchemy import select, func, desc
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from sqlalchemy import select, func, desc, tuple_, update, insert, exists, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import async_session_maker, get_db
 from app.db.models.asset import AssetMeta, AssetType, MarketDaily
 from app.db.models.sync import SyncHistory
 from app.core.redis_pubsub import subscribe_data_sync_events
+from app.core.responses import PydanticResponse, etag_matches
 
 router = APIRouter()
 
@@ -25,8 +31,19 @@ router = APIRouter()
 # Pydantic Schemas
 # ============================================
 
+# Response models are built once and serialized, never mutated
+_RESPONSE_CONFIG = ConfigDict(
+    from_attributes=True,
+    validate_assignment=False,
+    extra="ignore",
+    frozen=True,
+)
+
+
 class DataTableStatus(BaseModel):
     """Status of a data table."""
+    model_config = _RESPONSE_CONFIG
+
     name: str
     record_count: int
     date_range: Optional[str] = None
@@ -35,6 +52,8 @@ class DataTableStatus(BaseModel):
 
 class HealthDeduction(BaseModel):
     """Health score deduction item."""
+    model_config = _RESPONSE_CONFIG
+
     table: str
     reason: str
     points: int
@@ -42,6 +61,8 @@ class HealthDeduction(BaseModel):
 
 class SyncHistoryItem(BaseModel):
     """Sync history entry."""
+    model_config = _RESPONSE_CONFIG
+
     id: str
     sync_type: str
     status: str
@@ -53,12 +74,11 @@ class SyncHistoryItem(BaseModel):
     records_classified: int = 0
     error_message: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 class DataSyncStatusResponse(BaseModel):
     """Full data sync status response."""
+    model_config = _RESPONSE_CONFIG
+
     health_score: int = Field(ge=0, le=100, description="Overall health percentage")
     health_deductions: List[HealthDeduction] = Field(default_factory=list, description="Health score deduction breakdown")
     last_sync: Optional[SyncHistoryItem] = None
@@ -104,13 +124,17 @@ class SyncAnalysis(BaseModel):
 
 class SyncEventLog(BaseModel):
     """Single event log entry."""
-    type: str
-    timestamp: str
-    data: dict
+    model_config = _RESPONSE_CONFIG
+
+    type: str = "unknown"
+    timestamp: str = ""
+    data: dict = Field(default_factory=dict)
 
 
 class SyncJobDetail(BaseModel):
     """Detailed sync job info including event log."""
+    model_config = _RESPONSE_CONFIG
+
     id: str
     sync_type: str
     status: str
@@ -124,9 +148,6 @@ class SyncJobDetail(BaseModel):
     event_log: List[SyncEventLog] = Field(default_factory=list)
     steps_summary: Optional[dict] = None
 
-    class Config:
-        from_attributes = True
-
 
 class PaginatedSyncHistory(BaseModel):
     """Paginated sync history response."""
@@ -134,31 +155,98 @@ class PaginatedSyncHistory(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = Field(default=None, description="Opaque cursor for the next page")
 
 
-# ============================================
-# API Endpoints
-# ============================================
+# Validates/serializes a whole batch of history rows in one pydantic-core call
+_HISTORY_ADAPTER = TypeAdapter(List[SyncHistoryItem])
 
-@router.get("/status", response_model=DataSyncStatusResponse)
-async def get_sync_status(
-    db: AsyncSession = Depends(get_db),
-):
+# Validates a job's whole event log in one pydantic-core call
+_EVENT_LOG_ADAPTER = TypeAdapter(List[SyncEventLog])
+
+# Rows per streamed /history chunk
+_HISTORY_STREAM_CHUNK = 100
+
+# pg_advisory_xact_lock key serializing /trigger requests ("sync")
+_SYNC_TRIGGER_LOCK_ID = 0x73796E63
+
+# Columns backing SyncHistoryItem; read endpoints select these via .mappings()
+# instead of hydrating full SyncHistory entities
+_HISTORY_ITEM_COLUMNS = (
+    SyncHistory.id,
+    SyncHistory.sync_type,
+    SyncHistory.status,
+    SyncHistory.started_at,
+    SyncHistory.completed_at,
+    SyncHistory.duration_seconds,
+    SyncHistory.records_downloaded,
+    SyncHistory.records_imported,
+    SyncHistory.records_classified,
+    SyncHistory.error_message,
+)
+
+
+# Health score deductions keyed by table status
+_HEALTH_DEDUCTION_TEMPLATES = {
+    "Empty": {"reason": "表数据为空", "points": -20},
+    "Error": {"reason": "查询出错", "points": -10},
+}
+
+
+def _encode_history_cursor(started_at: datetime, job_id: str) -> str:
+    """Encode the (started_at, id) keyset position as an opaque cursor."""
+    raw = f"{started_at.isoformat()}|{job_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_history_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor produced by _encode_history_cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        started_at, job_id = raw.split("|", 1)
+        return datetime.fromisoformat(started_at), job_id
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+async def _status_etag() -> str:
     """
-    Get comprehensive data sync status.
+    Fingerprint of everything /status reports.
 
-    Returns:
-    - Health score (0-100)
-    - Last sync information
-    - Table statistics
-    - Missing dates count
+    One round-trip: latest sync row (covering index), market_daily row
+    count and date range, and asset count. Changes whenever a sync starts
+    or changes status, and whenever rows land in market_daily, including
+    rows for dates already present and historical backfills.
     """
-    # Get table statistics
-    tables = []
+    last_sync = (
+        select(SyncHistory.started_at, SyncHistory.status, SyncHistory.completed_at)
+        .order_by(desc(SyncHistory.started_at))
+        .limit(1)
+        .subquery()
+    )
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(
+                select(func.count(AssetMeta.code)).scalar_subquery(),
+                select(func.count(MarketDaily.code)).scalar_subquery(),
+                select(func.min(MarketDaily.date)).scalar_subquery(),
+                select(func.max(MarketDaily.date)).scalar_subquery(),
+                select(last_sync.c.started_at).scalar_subquery(),
+                select(last_sync.c.status).scalar_subquery(),
+                select(last_sync.c.completed_at).scalar_subquery(),
+            )
+        )
+        fingerprint = "|".join(str(v) for v in result.one())
+    return '"' + hashlib.blake2b(fingerprint.encode(), digest_size=8).hexdigest() + '"'
 
-    # Assets
-    try:
-        result = await db.execute(
+
+async def _assets_table_status() -> DataTableStatus:
+    """Asset counts by type for /status."""
+    async with async_session_maker() as session:
+        result = await session.execute(
             select(
                 func.count(AssetMeta.code).label('count'),
                 func.count().filter(AssetMeta.asset_type == AssetType.STOCK).label('stocks'),
@@ -167,18 +255,18 @@ async def get_sync_status(
             )
         )
         row = result.first()
-        tables.append(DataTableStatus(
-            name="Assets",
-            record_count=row.count if row else 0,
-            date_range=f"Stocks: {row.stocks}, ETFs: {row.etfs}, Indices: {row.indices}" if row else "-",
-            status="OK" if row and row.count > 0 else "Empty",
-        ))
-    except Exception:
-        tables.append(DataTableStatus(name="Assets", record_count=0, status="Error"))
+    return DataTableStatus(
+        name="Assets",
+        record_count=row.count if row else 0,
+        date_range=f"Stocks: {row.stocks}, ETFs: {row.etfs}, Indices: {row.indices}" if row else "-",
+        status="OK" if row and row.count > 0 else "Empty",
+    )
 
-    # Market Daily
-    try:
-        result = await db.execute(
+
+async def _market_daily_table_status() -> DataTableStatus:
+    """Market daily row count and date range for /status."""
+    async with async_session_maker() as session:
+        result = await session.execute(
             select(
                 func.count(MarketDaily.code).label('count'),
                 func.min(MarketDaily.date).label('min_date'),
@@ -186,68 +274,94 @@ async def get_sync_status(
             )
         )
         row = result.first()
-        date_range = f"{row.min_date} ~ {row.max_date}" if row and row.min_date else "-"
-        tables.append(DataTableStatus(
-            name="Market Daily",
-            record_count=row.count if row else 0,
-            date_range=date_range,
-            status="OK" if row and row.count > 0 else "Empty",
-        ))
+    date_range = f"{row.min_date} ~ {row.max_date}" if row and row.min_date else "-"
+    return DataTableStatus(
+        name="Market Daily",
+        record_count=row.count if row else 0,
+        date_range=date_range,
+        status="OK" if row and row.count > 0 else "Empty",
+    )
+
+
+async def _last_sync_item() -> Optional[SyncHistoryItem]:
+    """Most recent sync job for /status."""
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(*_HISTORY_ITEM_COLUMNS)
+            .order_by(desc(SyncHistory.started_at))
+            .limit(1)
+        )
+        row = result.mappings().one_or_none()
+    return SyncHistoryItem.model_validate(dict(row)) if row else None
+
+
+# ============================================
+# API Endpoints
+# ============================================
+
+@router.get("/status", response_model=DataSyncStatusResponse)
+async def get_sync_status(
+    request: Request,
+):
+    """
+    Get comprehensive data sync status.
+
+    Returns:
+    - Health score (0-100)
+    - Last sync information
+    - Table statistics
+    - Missing dates count
+
+    Sends an ETag; polls with a matching If-None-Match get 304 without
+    running the aggregate queries.
+    """
+    # Like the reads below, a failed fingerprint degrades the response
+    # (no ETag) rather than failing it
+    try:
+        etag = await _status_etag()
     except Exception:
-        tables.append(DataTableStatus(name="Market Daily", record_count=0, status="Error"))
+        etag = None
+    if etag is not None and etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    # Table statistics and last sync are independent reads; run them
+    # concurrently, each on its own session (AsyncSession is not safe for
+    # concurrent use)
+    assets, market_daily, last_sync = await asyncio.gather(
+        _assets_table_status(),
+        _market_daily_table_status(),
+        _last_sync_item(),
+        return_exceptions=True,
+    )
+    tables = [
+        DataTableStatus(name="Assets", record_count=0, status="Error")
+        if isinstance(assets, Exception) else assets,
+        DataTableStatus(name="Market Daily", record_count=0, status="Error")
+        if isinstance(market_daily, Exception) else market_daily,
+    ]
+    if isinstance(last_sync, Exception):
+        last_sync = None
 
     # Calculate health score with deduction breakdown
     health_score = 100
     health_deductions: List[HealthDeduction] = []
     for t in tables:
-        if t.status == "Empty":
-            health_deductions.append(HealthDeduction(
-                table=t.name,
-                reason="表数据为空",
-                points=-20,
-            ))
-            health_score -= 20
-        elif t.status == "Error":
-            health_deductions.append(HealthDeduction(
-                table=t.name,
-                reason="查询出错",
-                points=-10,
-            ))
-            health_score -= 10
+        template = _HEALTH_DEDUCTION_TEMPLATES.get(t.status)
+        if template:
+            health_deductions.append(HealthDeduction.model_construct(table=t.name, **template))
+            health_score += template["points"]
     health_score = max(0, health_score)
 
-    # Get last sync
-    last_sync = None
-    try:
-        result = await db.execute(
-            select(SyncHistory)
-            .order_by(desc(SyncHistory.started_at))
-            .limit(1)
-        )
-        sync_row = result.scalar_one_or_none()
-        if sync_row:
-            last_sync = SyncHistoryItem(
-                id=sync_row.id,
-                sync_type=sync_row.sync_type,
-                status=sync_row.status,
-                started_at=sync_row.started_at,
-                completed_at=sync_row.completed_at,
-                duration_seconds=float(sync_row.duration_seconds) if sync_row.duration_seconds else None,
-                records_downloaded=sync_row.records_downloaded,
-                records_imported=sync_row.records_imported,
-                records_classified=sync_row.records_classified,
-                error_message=sync_row.error_message,
-            )
-    except Exception:
-        pass
-
-    return DataSyncStatusResponse(
-        health_score=health_score,
-        health_deductions=health_deductions,
-        last_sync=last_sync,
-        tables=tables,
-        missing_dates_count=0,
-        worker_status="unknown",
+    return PydanticResponse(
+        DataSyncStatusResponse(
+            health_score=health_score,
+            health_deductions=health_deductions,
+            last_sync=last_sync,
+            tables=tables,
+            missing_dates_count=0,
+            worker_status="unknown",
+        ),
+        headers={"ETag": etag} if etag is not None else None,
     )
 
 
@@ -265,31 +379,46 @@ async def trigger_sync(
     from uuid import uuid4
     from app.core.arq import get_arq_pool
 
-    # Check if there's already a running or queued sync job
-    existing_job = await db.execute(
-        select(SyncHistory)
-        .where(SyncHistory.status.in_(["running", "queued"]))
-        .order_by(desc(SyncHistory.started_at))
-        .limit(1)
+    job_id = str(uuid4())
+    active_jobs = select(SyncHistory.id).where(SyncHistory.status.in_(["running", "queued"]))
+
+    # Under READ COMMITTED two triggers could both pass NOT EXISTS on their
+    # own snapshots and both insert. The transaction-scoped advisory lock
+    # makes a concurrent trigger wait until this one commits; its INSERT
+    # then runs on a fresh snapshot, sees the queued row and gets a 409.
+    await db.execute(select(func.pg_advisory_xact_lock(_SYNC_TRIGGER_LOCK_ID)))
+
+    # Create sync history record only if no job is running or queued
+    result = await db.execute(
+        insert(SyncHistory)
+        .from_select(
+            ["id", "sync_type", "status", "triggered_by"],
+            select(
+                literal(job_id, SyncHistory.id.type),
+                literal(request.sync_type, SyncHistory.sync_type.type),
+                literal("queued", SyncHistory.status.type),
+                literal("api", SyncHistory.triggered_by.type),
+            ).where(~exists(active_jobs)),
+        )
+        .returning(SyncHistory.id)
     )
-    existing = existing_job.scalar_one_or_none()
+    inserted = result.scalar_one_or_none()
 
-    if existing:
+    if inserted is None:
+        existing_result = await db.execute(
+            select(SyncHistory.id, SyncHistory.status)
+            .where(SyncHistory.status.in_(["running", "queued"]))
+            .order_by(desc(SyncHistory.started_at))
+            .limit(1)
+        )
+        existing = existing_result.one_or_none()
+        existing_desc = f"ID: {existing.id[:8]}..., 状态: {existing.status}" if existing else "状态: unknown"
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail=f"同步任务已在进行中 (ID: {existing.id[:8]}..., 状态: {existing.status}). 请等待当前任务完成后再试。",
+            detail=f"同步任务已在进行中 ({existing_desc}). 请等待当前任务完成后再试。",
         )
 
-    job_id = str(uuid4())
-
-    # Create sync history record
-    sync_record = SyncHistory(
-        id=job_id,
-        sync_type=request.sync_type,
-        status="queued",
-        triggered_by="api",
-    )
-    db.add(sync_record)
+    # Commit before enqueueing so the worker can always see the record
     await db.commit()
 
     # Enqueue to ARQ worker
@@ -298,70 +427,106 @@ async def trigger_sync(
         await arq_pool.enqueue_job("api_triggered_sync", job_id)
     except Exception as e:
         # If ARQ is not available, update record to failed
-        sync_record.status = "failed"
-        sync_record.error_message = f"Failed to enqueue: {str(e)}"
+        await db.execute(
+            update(SyncHistory)
+            .where(SyncHistory.id == job_id)
+            .values(status="failed", error_message=f"Failed to enqueue: {str(e)}")
+        )
         await db.commit()
-        return TriggerSyncResponse(
+        return PydanticResponse(TriggerSyncResponse(
             job_id=job_id,
             status="failed",
             message=f"Failed to enqueue sync job: {str(e)}",
-        )
+        ))
 
-    return TriggerSyncResponse(
+    return PydanticResponse(TriggerSyncResponse(
         job_id=job_id,
         status="queued",
         message=f"Sync job {request.sync_type} has been queued",
-    )
+    ))
 
 
 @router.get("/history", response_model=PaginatedSyncHistory)
 async def get_sync_history(
-    limit: int = 10,
-    offset: int = 0,
-    db: AsyncSession = Depends(get_db),
+    limit: int = Query(default=10, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = None,
 ):
     """
     Get paginated sync history.
 
     Returns the most recent sync operations with pagination.
+    Pass the previous page's `next_cursor` as `cursor` for keyset pagination
+    (seeks on the (started_at, id) index instead of scanning `offset` rows).
     """
-    # Get total count
-    count_result = await db.execute(select(func.count(SyncHistory.id)))
-    total = count_result.scalar() or 0
-
     # Get paginated items
-    result = await db.execute(
-        select(SyncHistory)
-        .order_by(desc(SyncHistory.started_at))
+    query = (
+        select(*_HISTORY_ITEM_COLUMNS)
+        .order_by(desc(SyncHistory.started_at), desc(SyncHistory.id))
         .limit(limit)
-        .offset(offset)
     )
-    rows = result.scalars().all()
-
-    items = [
-        SyncHistoryItem(
-            id=row.id,
-            sync_type=row.sync_type,
-            status=row.status,
-            started_at=row.started_at,
-            completed_at=row.completed_at,
-            duration_seconds=float(row.duration_seconds) if row.duration_seconds else None,
-            records_downloaded=row.records_downloaded,
-            records_imported=row.records_imported,
-            records_classified=row.records_classified,
-            error_message=row.error_message,
+    if cursor:
+        cur_started_at, cur_id = _decode_history_cursor(cursor)
+        query = query.where(
+            tuple_(SyncHistory.started_at, SyncHistory.id) < tuple_(cur_started_at, cur_id)
         )
-        for row in rows
-    ]
+    else:
+        query = query.offset(offset)
 
-    return PaginatedSyncHistory(
-        items=items,
-        total=total,
-        limit=limit,
-        offset=offset,
+    return StreamingResponse(
+        _stream_sync_history(query, limit, offset),
+        media_type="application/json",
     )
 
 
+async def _count_sync_history() -> int:
+    """Total sync history rows, on a dedicated session so it can overlap the page."""
+    async with async_session_maker() as session:
+        result = await session.execute(select(func.count(SyncHistory.id)))
+        return result.scalar() or 0
+
+
+async def _stream_sync_history(query, limit: int, offset: int) -> AsyncIterator[bytes]:
+    """
+    Emit a PaginatedSyncHistory JSON body row by row.
+
+    The total is counted concurrently on a second session while the page
+    streams, so neither offset nor cursor pages wait on the COUNT first.
+    Uses its own session because the request-scoped one may already be
+    closed by the time the response body is consumed.
+    """
+    count_task = asyncio.create_task(_count_sync_history())
+    try:
+        yield b'{"items":['
+        count = 0
+        last = None
+        async with async_session_maker() as session:
+            result = await session.stream(query)
+            async for rows in result.mappings().partitions(_HISTORY_STREAM_CHUNK):
+                items = _HISTORY_ADAPTER.validate_python([dict(r) for r in rows])
+                if count:
+                    yield b","
+                yield _HISTORY_ADAPTER.dump_json(items)[1:-1]
+                count += len(rows)
+                last = (rows[-1]["started_at"], rows[-1]["id"])
+
+        total = await count_task
+    finally:
+        if not count_task.done():
+            count_task.cancel()
+
+    next_cursor = None
+    if count == limit and last is not None:
+        next_cursor = _encode_history_cursor(*last)
+
+    yield b"]," + orjson.dumps({
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": next_cursor,
+    })[1:]
+
+
 @router.get("/job/{job_id}", response_model=SyncHistoryItem)
 async def get_sync_job(
     job_id: str,
@@ -373,9 +538,9 @@ async def get_sync_job(
     Use this endpoint to poll for job progress after triggering a sync.
     """
     result = await db.execute(
-        select(SyncHistory).where(SyncHistory.id == job_id)
+        select(*_HISTORY_ITEM_COLUMNS).where(SyncHistory.id == job_id)
     )
-    row = result.scalar_one_or_none()
+    row = result.mappings().one_or_none()
 
     if not row:
         raise HTTPException(
@@ -383,18 +548,7 @@ async def get_sync_job(
             detail=f"Sync job {job_id} not found",
         )
 
-    return SyncHistoryItem(
-        id=row.id,
-        sync_type=row.sync_type,
-        status=row.status,
-        started_at=row.started_at,
-        completed_at=row.completed_at,
-        duration_seconds=float(row.duration_seconds) if row.duration_seconds else None,
-        records_downloaded=row.records_downloaded,
-        records_imported=row.records_imported,
-        records_classified=row.records_classified,
-        error_message=row.error_message,
-    )
+    return PydanticResponse(SyncHistoryItem.model_validate(dict(row)))
 
 
 @router.post("/cancel/{job_id}")
@@ -433,10 +587,6 @@ async def cancel_sync_job(
     return {"status": "cancelled", "job_id": job_id, "message": "Sync job cancelled"}
 
 
-# Stale task detection threshold (minutes)
-STALE_THRESHOLD_MINUTES = 60
-
-
 @router.get("/active", response_model=Optional[SyncHistoryItem])
 async def get_active_sync_job(
     db: AsyncSession = Depends(get_db),
@@ -445,47 +595,21 @@ async def get_active_sync_job(
     Get the current active sync job if one exists.
 
     Returns the most recent queued or running job, or null if no active job.
-    Also detects and marks stale tasks (running > 60 minutes) automatically.
+    Stale tasks (running > 60 minutes) are marked by the mark_stale_sync_jobs
+    worker cron, so this endpoint is read-only.
     """
-    from datetime import timedelta
-
     result = await db.execute(
-        select(SyncHistory)
+        select(*_HISTORY_ITEM_COLUMNS)
         .where(SyncHistory.status.in_(["queued", "running"]))
         .order_by(desc(SyncHistory.started_at))
         .limit(1)
     )
-    row = result.scalar_one_or_none()
+    row = result.mappings().one_or_none()
 
     if not row:
-        return None
-
-    # Check for stale task
-    if row.status == "running" and row.started_at:
-        # Handle timezone-aware datetime
-        now = datetime.now()
-        started = row.started_at.replace(tzinfo=None) if row.started_at.tzinfo else row.started_at
-        running_time = now - started
-
-        if running_time > timedelta(minutes=STALE_THRESHOLD_MINUTES):
-            # Mark as stale
-            row.status = "stale"
-            row.completed_at = datetime.now()
-            row.error_message = f"Task exceeded {STALE_THRESHOLD_MINUTES} minutes timeout - marked as stale"
-            await db.commit()
-
-    return SyncHistoryItem(
-        id=row.id,
-        sync_type=row.sync_type,
-        status=row.status,
-        started_at=row.started_at,
-        completed_at=row.completed_at,
-        duration_seconds=float(row.duration_seconds) if row.duration_seconds else None,
-        records_downloaded=row.records_downloaded,
-        records_imported=row.records_imported,
-        records_classified=row.records_classified,
-        error_message=row.error_message,
-    )
+        return PydanticResponse(None)
+
+    return PydanticResponse(SyncHistoryItem.model_validate(dict(row)))
 
 
 @router.get("/job/{job_id}/events")
@@ -530,35 +654,79 @@ async def get_data_completeness(
 
     Returns coverage statistics for market data.
     """
-    # Get asset count
-    asset_result = await db.execute(select(func.count(AssetMeta.code)))
-    total_assets = asset_result.scalar() or 0
-
-    # Get date range and trading days
-    date_result = await db.execute(
+    # Asset count (as a scalar subquery) and date aggregates in one round-trip
+    result = await db.execute(
         select(
+            select(func.count(AssetMeta.code)).scalar_subquery().label('assets'),
             func.count(func.distinct(MarketDaily.date)).label('days'),
             func.min(MarketDaily.date).label('min_date'),
             func.max(MarketDaily.date).label('max_date'),
         )
     )
-    date_row = date_result.first()
+    row = result.one()
 
-    total_trading_days = date_row.days if date_row else 0
-    earliest = str(date_row.min_date) if date_row and date_row.min_date else None
-    latest = str(date_row.max_date) if date_row and date_row.max_date else None
+    total_assets = row.assets or 0
+    total_trading_days = row.days or 0
+    earliest = str(row.min_date) if row.min_date else None
+    latest = str(row.max_date) if row.max_date else None
 
     # Calculate coverage (simplified)
     coverage = 100.0 if total_assets > 0 and total_trading_days > 0 else 0.0
 
-    return DataCompletenessResponse(
+    return PydanticResponse(DataCompletenessResponse(
         total_assets=total_assets,
         total_trading_days=total_trading_days,
         data_coverage_pct=coverage,
         earliest_date=earliest,
         latest_date=latest,
         missing_dates=[],
-    )
+    ))
+
+
+# ============================================
+# Trading calendar memoization
+# ============================================
+# The calendar lookups hit baostock/akshare over the network. Their answers
+# only change on date rollover (and, for the latest trading day, at the
+# 17:00 close), so cache per process keyed by that bucket. Misses run in a
+# worker thread so the blocking client calls don't stall the event loop.
+
+_calendar_cache: Dict[tuple, Any] = {}
+_calendar_cache_day: int = 0
+
+
+def _calendar_cache_get(key: tuple) -> Any:
+    """Look up a calendar cache entry, dropping everything on date rollover."""
+    global _calendar_cache_day
+    today_ord = date.today().toordinal()
+    if today_ord != _calendar_cache_day:
+        _calendar_cache.clear()
+        _calendar_cache_day = today_ord
+    return _calendar_cache.get(key)
+
+
+async def get_latest_trading_day_cached() -> Tuple[date, str]:
+    """Memoized get_latest_trading_day_with_source(), off the event loop."""
+    from workers.batch_sync import get_latest_trading_day_with_source
+
+    key = ("latest", datetime.now().hour >= 17)
+    cached = _calendar_cache_get(key)
+    if cached is None:
+        cached = await asyncio.to_thread(get_latest_trading_day_with_source)
+        _calendar_cache[key] = cached
+    return cached
+
+
+async def get_trading_days_between_cached(start_date: date, end_date: date) -> List[date]:
+    """Memoized get_trading_days_between(), off the event loop."""
+    from workers.batch_sync import get_trading_days_between
+
+    key = ("between", start_date.toordinal(), end_date.toordinal())
+    cached = _calendar_cache_get(key)
+    if cached is None:
+        cached = await asyncio.to_thread(get_trading_days_between, start_date, end_date)
+        _calendar_cache[key] = cached
+    return cached
 
 
 @router.get("/analyze", response_model=SyncAnalysis)
@@ -572,10 +740,7 @@ async def analyze_sync_requirements(
     Checks all data types: stocks, ETF, and indices.
     Compares with latest trading day (not today) to account for weekends/holidays.
     """
-    from datetime import date
     from workers.batch_sync import (
-        get_latest_trading_day_with_source,
-        get_trading_days_between,
         get_pg_max_date,
         get_pg_index_max_date,
     )
@@ -584,7 +749,7 @@ async def analyze_sync_requirements(
     today_str = today.strftime("%Y-%m-%d")
 
     # Get latest trading day (accounting for weekends/holidays) with source info
-    latest_trading_day, trading_day_source = get_latest_trading_day_with_source()
+    latest_trading_day, trading_day_source = await get_latest_trading_day_cached()
     latest_trading_day_str = latest_trading_day.strftime("%Y-%m-%d")
 
     # Get latest data date for each data type
@@ -623,7 +788,7 @@ async def analyze_sync_requirements(
             stale_types.append(f"指数:{index_date or '空'}")
 
         # Calculate trading days from the oldest date
-        missing_days = get_trading_days_between(latest_date, latest_trading_day)
+        missing_days = await get_trading_days_between_cached(latest_date, latest_trading_day)
         days_diff = len(missing_days)
 
         if len(stale_types) == 1:
@@ -631,7 +796,7 @@ async def analyze_sync_requirements(
         else:
             message = f"需更新: {', '.join(stale_types)} (目标: {latest_trading_day_str})"
 
-    return SyncAnalysis(
+    return PydanticResponse(SyncAnalysis(
         latest_data_date=latest_date_str,
         latest_trading_day=latest_trading_day_str,
         trading_day_source=trading_day_source,
@@ -639,7 +804,7 @@ async def analyze_sync_requirements(
         days_to_update=days_diff,
         needs_sync=needs_sync,
         message=message,
-    )
+    ))
 
 
 @router.get("/job/{job_id}/detail", response_model=SyncJobDetail)
@@ -655,9 +820,9 @@ async def get_sync_job_detail(
     2. Viewing history logs
     """
     result = await db.execute(
-        select(SyncHistory).where(SyncHistory.id == job_id)
+        select(*_HISTORY_ITEM_COLUMNS, SyncHistory.details).where(SyncHistory.id == job_id)
     )
-    job = result.scalar_one_or_none()
+    job = result.mappings().one_or_none()
 
     if not job:
         raise HTTPException(
@@ -665,32 +830,18 @@ async def get_sync_job_detail(
             detail=f"Sync job {job_id} not found",
         )
 
+    job = dict(job)
+    details = job.pop("details")
+
     # Extract event_log from details
     event_log = []
     steps_summary = None
-    if job.details:
-        event_log_raw = job.details.get("event_log", [])
-        event_log = [
-            SyncEventLog(
-                type=e.get("type", "unknown"),
-                timestamp=e.get("timestamp", ""),
-                data=e.get("data", {}),
-            )
-            for e in event_log_raw
-        ]
-        steps_summary = job.details.get("steps")
-
-    return SyncJobDetail(
-        id=job.id,
-        sync_type=job.sync_type,
-        status=job.status,
-        started_at=job.started_at,
-        completed_at=job.completed_at,
-        duration_seconds=float(job.duration_seconds) if job.duration_seconds else None,
-        records_downloaded=job.records_downloaded,
-        records_imported=job.records_imported,
-        records_classified=job.records_classified,
-        error_message=job.error_message,
-        event_log=event_log,
-        steps_summary=steps_summary,
-    )
+    if details:
+        event_log = _EVENT_LOG_ADAPTER.validate_python(details.get("event_log", []))
+        steps_summary = details.get("steps")
+
+    return PydanticResponse(SyncJobDetail.model_validate({
+        **job,
+        "event_log": event_log,
+        "steps_summary": steps_summary,
+    }))
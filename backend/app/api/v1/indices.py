@@ -3,23 +3,27 @@
 Provides access to index information and industry composition.
 """
 
+import asyncio
+import base64
 from datetime import date, datetime
 from typing import List, Optional, Dict, Any
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from pydantic import BaseModel, Field
-from sqlalchemy import select, func, desc
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from pydantic import BaseModel, Field, TypeAdapter
+from sqlalchemy import select, func, desc, cast, Float, and_, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from app.db.session import get_db
+from app.core.response_cache import INDICES_CACHE_NAMESPACE, cached_response
+from app.core.responses import ORJSONResponse, PydanticResponse
+from app.db.session import async_session_maker, get_db
 from app.db.models.asset import AssetMeta, AssetType
-from app.db.models.profile import IndexProfile
+from app.db.models.profile import IndexProfile, index_industry_sw_l1
 from app.db.models.stock_pool import IndexConstituent
 
 router = APIRouter()
 
-
 # ============================================
 # Pydantic Schemas
 # ============================================
@@ -46,6 +50,7 @@ class IndexListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = Field(default=None, description="Opaque cursor for the next page")
 
 
 class IndustryWeight(BaseModel):
@@ -97,79 +102,139 @@ class IndexByIndustryResponse(BaseModel):
     industry_weight: float
 
 
+# Validates a whole industry->weight mapping in one pydantic-core call
+_INDUSTRY_WEIGHTS_ADAPTER = TypeAdapter(List[IndustryWeight])
+
+
+def _to_industry_weights(weights: Dict[str, float]) -> List[IndustryWeight]:
+    """Convert a composition level ({industry: weight}) to IndustryWeight items."""
+    return _INDUSTRY_WEIGHTS_ADAPTER.validate_python(
+        [{"industry": k, "weight": v} for k, v in weights.items()]
+    )
+
+
+# Columns for IndexBasicResponse, cast in SQL so rows can be used as-is
+_INDEX_BASIC_COLUMNS = (
+    AssetMeta.code,
+    AssetMeta.name,
+    IndexProfile.short_name,
+    IndexProfile.index_type,
+    func.coalesce(IndexProfile.constituent_count, 0).label("constituent_count"),
+    IndexProfile.top_industry_l1,
+    cast(IndexProfile.top_industry_weight, Float).label("top_industry_weight"),
+    cast(IndexProfile.herfindahl_index, Float).label("herfindahl_index"),
+    IndexProfile.composition_updated_at,
+)
+
+
+def _encode_index_cursor(code: str) -> str:
+    """Encode the code keyset position as an opaque cursor."""
+    return base64.urlsafe_b64encode(code.encode()).decode()
+
+
+def _decode_index_cursor(cursor: str) -> str:
+    """Decode a cursor produced by _encode_index_cursor."""
+    try:
+        code = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except ValueError:
+        code = ""
+    if not code:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    return code
+
+
+async def _scalar_in_own_session(query):
+    """Run a scalar query on a dedicated session so it can be gathered."""
+    async with async_session_maker() as session:
+        result = await session.execute(query)
+        return result.scalar()
+
+
 # ============================================
 # API Endpoints
 # ============================================
 
 @router.get("", response_model=IndexListResponse)
+@cached_response(namespace=INDICES_CACHE_NAMESPACE)
 async def list_indices(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     index_type: Optional[str] = Query(None, description="Filter by index type (broad_based, sector, theme)"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (next_cursor of the previous page)"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     List all indices with basic info and industry composition summary.
 
     Returns paginated list of indices with their top industry and concentration metrics.
+    Pass `cursor` to seek past the previous page on code (within the
+    asset_type = INDEX slice of the (asset_type, code) index) instead of
+    using `page`.
     """
     # Build query
     query = (
-        select(
-            AssetMeta.code,
-            AssetMeta.name,
-            IndexProfile.short_name,
-            IndexProfile.index_type,
-            IndexProfile.constituent_count,
-            IndexProfile.top_industry_l1,
-            IndexProfile.top_industry_weight,
-            IndexProfile.herfindahl_index,
-            IndexProfile.composition_updated_at,
-        )
+        select(*_INDEX_BASIC_COLUMNS)
         .select_from(AssetMeta)
         .outerjoin(IndexProfile, AssetMeta.code == IndexProfile.code)
         .where(AssetMeta.asset_type == AssetType.INDEX)
     )
 
+    # Count on asset_meta alone; index_profile is 1:1 by code, so it is
+    # only joined when the type filter needs it.
+    count_query = (
+        select(func.count(AssetMeta.code))
+        .where(AssetMeta.asset_type == AssetType.INDEX)
+    )
+
     if index_type:
         query = query.where(IndexProfile.index_type == index_type)
+        count_query = (
+            count_query
+            .join(IndexProfile, AssetMeta.code == IndexProfile.code)
+            .where(IndexProfile.index_type == index_type)
+        )
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    # Apply pagination (fetch one extra row to detect a next page)
+    query = query.order_by(AssetMeta.code).limit(page_size + 1)
+    if cursor:
+        query = query.where(AssetMeta.code > _decode_index_cursor(cursor))
+    else:
+        query = query.offset((page - 1) * page_size)
 
-    # Apply pagination
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    # Count and page are independent: overlap them, with the count on its
+    # own session since one AsyncSession can't run two statements at once.
+    total, result = await asyncio.gather(
+        _scalar_in_own_session(count_query),
+        db.execute(query),
+    )
+    total = total or 0
+    rows = result.mappings().all()
 
-    result = await db.execute(query)
-    rows = result.all()
-
-    items = [
-        IndexBasicResponse(
-            code=row.code,
-            name=row.name,
-            short_name=row.short_name,
-            index_type=row.index_type,
-            constituent_count=row.constituent_count or 0,
-            top_industry_l1=row.top_industry_l1,
-            top_industry_weight=float(row.top_industry_weight) if row.top_industry_weight else None,
-            herfindahl_index=float(row.herfindahl_index) if row.herfindahl_index else None,
-            composition_updated_at=row.composition_updated_at,
-        )
-        for row in rows
-    ]
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = _encode_index_cursor(rows[-1]["code"])
+
+    # Columns are already cast/coalesced in SQL to the response types
+    items = [IndexBasicResponse.model_construct(**row) for row in rows]
 
-    return IndexListResponse(
+    return PydanticResponse(IndexListResponse.model_construct(
         items=items,
         total=total,
         page=page,
         page_size=page_size,
-    )
+        next_cursor=next_cursor,
+    ))
 
 
 @router.get("/industry-concentration", response_model=List[IndexConcentrationResponse])
+@cached_response(namespace=INDICES_CACHE_NAMESPACE)
 async def get_industry_concentration(
+    request: Request,
     limit: int = Query(20, ge=1, le=100, description="Number of results"),
     order: str = Query("desc", description="Sort order (asc/desc)"),
     db: AsyncSession = Depends(get_db),
@@ -184,10 +249,10 @@ async def get_industry_concentration(
             AssetMeta.code,
             AssetMeta.name,
             IndexProfile.index_type,
-            IndexProfile.constituent_count,
-            IndexProfile.top_industry_l1,
-            IndexProfile.top_industry_weight,
-            IndexProfile.herfindahl_index,
+            func.coalesce(IndexProfile.constituent_count, 0).label("constituent_count"),
+            IndexProfile.top_industry_l1.label("top_industry"),
+            cast(IndexProfile.top_industry_weight, Float).label("top_industry_weight"),
+            cast(IndexProfile.herfindahl_index, Float).label("herfindahl_index"),
         )
         .select_from(AssetMeta)
         .join(IndexProfile, AssetMeta.code == IndexProfile.code)
@@ -203,24 +268,15 @@ async def get_industry_concentration(
     query = query.limit(limit)
 
     result = await db.execute(query)
-    rows = result.all()
-
-    return [
-        IndexConcentrationResponse(
-            code=row.code,
-            name=row.name,
-            index_type=row.index_type,
-            constituent_count=row.constituent_count or 0,
-            top_industry=row.top_industry_l1,
-            top_industry_weight=float(row.top_industry_weight) if row.top_industry_weight else None,
-            herfindahl_index=float(row.herfindahl_index) if row.herfindahl_index else None,
-        )
-        for row in rows
-    ]
+
+    # Rows already match IndexConcentrationResponse; skip per-row validation
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 @router.get("/by-industry", response_model=List[IndexByIndustryResponse])
+@cached_response(namespace=INDICES_CACHE_NAMESPACE)
 async def get_indices_by_industry(
+    request: Request,
     industry: str = Query(..., description="Industry name (SW L1)"),
     min_weight: float = Query(0.0, ge=0, le=1, description="Minimum weight threshold"),
     limit: int = Query(20, ge=1, le=100, description="Number of results"),
@@ -231,73 +287,51 @@ async def get_indices_by_industry(
 
     Returns indices sorted by weight in the specified industry.
     """
-    # Get all index profiles with compositions
+    # index_industry_sw_l1 flattens the SW L1 composition into
+    # (code, industry, weight) rows, so this is a range scan on
+    # (industry, weight DESC) rather than JSONB extraction per profile.
     query = (
         select(
             AssetMeta.code,
             AssetMeta.name,
             IndexProfile.index_type,
-            IndexProfile.industry_composition,
+            index_industry_sw_l1.c.weight.label("industry_weight"),
         )
-        .select_from(AssetMeta)
-        .join(IndexProfile, AssetMeta.code == IndexProfile.code)
+        .select_from(index_industry_sw_l1)
+        .join(AssetMeta, AssetMeta.code == index_industry_sw_l1.c.code)
+        .join(IndexProfile, IndexProfile.code == index_industry_sw_l1.c.code)
+        .where(index_industry_sw_l1.c.industry == industry)
+        .where(index_industry_sw_l1.c.weight >= min_weight)
         .where(AssetMeta.asset_type == AssetType.INDEX)
-        .where(IndexProfile.industry_composition.isnot(None))
+        .order_by(desc(index_industry_sw_l1.c.weight))
+        .limit(limit)
     )
 
     result = await db.execute(query)
-    rows = result.all()
-
-    # Filter and sort by industry weight
-    matching_indices = []
-    for row in rows:
-        composition = row.industry_composition or {}
-        sw_l1 = composition.get("sw_l1", {})
-        weight = sw_l1.get(industry, 0)
 
-        if weight >= min_weight:
-            matching_indices.append({
-                "code": row.code,
-                "name": row.name,
-                "index_type": row.index_type,
-                "industry_weight": weight,
-            })
-
-    # Sort by weight descending
-    matching_indices.sort(key=lambda x: x["industry_weight"], reverse=True)
-
-    return [
-        IndexByIndustryResponse(**idx)
-        for idx in matching_indices[:limit]
-    ]
+    # Rows already match IndexByIndustryResponse; skip per-row validation
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 @router.get("/{code}", response_model=IndexBasicResponse)
+@cached_response(namespace=INDICES_CACHE_NAMESPACE)
 async def get_index(
+    request: Request,
     code: str,
     db: AsyncSession = Depends(get_db),
 ):
     """Get basic info for a specific index."""
-    query = (
-        select(
-            AssetMeta.code,
-            AssetMeta.name,
-            IndexProfile.short_name,
-            IndexProfile.index_type,
-            IndexProfile.constituent_count,
-            IndexProfile.top_industry_l1,
-            IndexProfile.top_industry_weight,
-            IndexProfile.herfindahl_index,
-            IndexProfile.composition_updated_at,
-        )
+    # lambda_stmt: the statement is built once and cached; `code` is bound
+    query = lambda_stmt(lambda: (
+        select(*_INDEX_BASIC_COLUMNS)
         .select_from(AssetMeta)
         .outerjoin(IndexProfile, AssetMeta.code == IndexProfile.code)
         .where(AssetMeta.code == code)
         .where(AssetMeta.asset_type == AssetType.INDEX)
-    )
+    ))
 
     result = await db.execute(query)
-    row = result.first()
+    row = result.mappings().first()
 
     if not row:
         raise HTTPException(
@@ -305,21 +339,13 @@ async def get_index(
             detail=f"Index {code} not found",
         )
 
-    return IndexBasicResponse(
-        code=row.code,
-        name=row.name,
-        short_name=row.short_name,
-        index_type=row.index_type,
-        constituent_count=row.constituent_count or 0,
-        top_industry_l1=row.top_industry_l1,
-        top_industry_weight=float(row.top_industry_weight) if row.top_industry_weight else None,
-        herfindahl_index=float(row.herfindahl_index) if row.herfindahl_index else None,
-        composition_updated_at=row.composition_updated_at,
-    )
+    return PydanticResponse(IndexBasicResponse.model_construct(**row))
 
 
 @router.get("/{code}/industry-composition", response_model=IndustryCompositionResponse)
+@cached_response(namespace=INDICES_CACHE_NAMESPACE)
 async def get_index_industry_composition(
+    request: Request,
     code: str,
     db: AsyncSession = Depends(get_db),
 ):
@@ -328,21 +354,21 @@ async def get_index_industry_composition(
 
     Returns weights for all industry levels (SW L1/L2/L3, EM).
     """
-    query = (
+    query = lambda_stmt(lambda: (
         select(
             AssetMeta.code,
             AssetMeta.name,
-            IndexProfile.constituent_count,
+            func.coalesce(IndexProfile.constituent_count, 0).label("constituent_count"),
             IndexProfile.industry_composition,
             IndexProfile.top_industry_l1,
-            IndexProfile.top_industry_weight,
-            IndexProfile.herfindahl_index,
+            cast(IndexProfile.top_industry_weight, Float).label("top_industry_weight"),
+            cast(IndexProfile.herfindahl_index, Float).label("herfindahl_index"),
         )
         .select_from(AssetMeta)
         .outerjoin(IndexProfile, AssetMeta.code == IndexProfile.code)
         .where(AssetMeta.code == code)
         .where(AssetMeta.asset_type == AssetType.INDEX)
-    )
+    ))
 
     result = await db.execute(query)
     row = result.first()
@@ -355,27 +381,26 @@ async def get_index_industry_composition(
 
     composition = row.industry_composition or {}
 
-    def to_weights(d: Dict[str, float]) -> List[IndustryWeight]:
-        return [IndustryWeight(industry=k, weight=v) for k, v in d.items()]
-
-    return IndustryCompositionResponse(
+    return PydanticResponse(IndustryCompositionResponse.model_construct(
         code=row.code,
         name=row.name,
-        constituent_count=row.constituent_count or 0,
+        constituent_count=row.constituent_count,
         computation_date=composition.get("computation_date"),
         total_weight_covered=composition.get("total_weight_covered"),
-        sw_l1=to_weights(composition.get("sw_l1", {})),
-        sw_l2=to_weights(composition.get("sw_l2", {})),
-        sw_l3=to_weights(composition.get("sw_l3", {})),
-        em=to_weights(composition.get("em", {})),
+        sw_l1=_to_industry_weights(composition.get("sw_l1", {})),
+        sw_l2=_to_industry_weights(composition.get("sw_l2", {})),
+        sw_l3=_to_industry_weights(composition.get("sw_l3", {})),
+        em=_to_industry_weights(composition.get("em", {})),
         top_industry=row.top_industry_l1,
-        top_industry_weight=float(row.top_industry_weight) if row.top_industry_weight else None,
-        herfindahl_index=float(row.herfindahl_index) if row.herfindahl_index else None,
-    )
+        top_industry_weight=row.top_industry_weight,
+        herfindahl_index=row.herfindahl_index,
+    ))
 
 
 @router.get("/{code}/constituents", response_model=List[ConstituentResponse])
+@cached_response(namespace=INDICES_CACHE_NAMESPACE)
 async def get_index_constituents(
+    request: Request,
     code: str,
     include_expired: bool = Query(False, description="Include expired constituents"),
     db: AsyncSession = Depends(get_db),
@@ -385,46 +410,36 @@ async def get_index_constituents(
 
     Returns current constituents with weights.
     """
-    # First check if index exists
-    index_query = (
-        select(AssetMeta.code)
-        .where(AssetMeta.code == code)
-        .where(AssetMeta.asset_type == AssetType.INDEX)
-    )
-    index_result = await db.execute(index_query)
-    if not index_result.first():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Index {code} not found",
-        )
+    # One round-trip: start from the index row and LEFT JOIN its
+    # constituents, so an existing index always yields at least one row
+    # (a NULL-constituent sentinel when it has none).
+    index_meta = aliased(AssetMeta)
+    constituent_join = IndexConstituent.index_code == index_meta.code
+    if not include_expired:
+        constituent_join = and_(constituent_join, IndexConstituent.expire_date.is_(None))
 
-    # Get constituents
     query = (
         select(
             IndexConstituent.stock_code,
-            IndexConstituent.weight,
-            IndexConstituent.entry_date,
             AssetMeta.name.label("stock_name"),
+            cast(IndexConstituent.weight, Float).label("weight"),
+            IndexConstituent.effective_date.label("entry_date"),
         )
-        .select_from(IndexConstituent)
+        .select_from(index_meta)
+        .outerjoin(IndexConstituent, constituent_join)
         .outerjoin(AssetMeta, IndexConstituent.stock_code == AssetMeta.code)
-        .where(IndexConstituent.index_code == code)
+        .where(index_meta.code == code)
+        .where(index_meta.asset_type == AssetType.INDEX)
+        .order_by(desc(IndexConstituent.weight))
     )
 
-    if not include_expired:
-        query = query.where(IndexConstituent.expire_date.is_(None))
-
-    query = query.order_by(desc(IndexConstituent.weight))
-
     result = await db.execute(query)
-    rows = result.all()
-
-    return [
-        ConstituentResponse(
-            stock_code=row.stock_code,
-            stock_name=row.stock_name,
-            weight=float(row.weight) if row.weight else None,
-            entry_date=row.entry_date,
+    rows = result.mappings().all()
+
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Index {code} not found",
         )
-        for row in rows
-    ]
+
+    return ORJSONResponse([dict(row) for row in rows if row["stock_code"] is not None])
@@ -1,17 +1,25 @@
 """Stock pool API endpoints."""
 
+import asyncio
+import base64
+import time
 import uuid
 from datetime import date, datetime
-from typing import List, Optional, Dict, Any, Set
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import select, func, and_, or_, text
+from sqlalchemy import Row, select, insert, update, delete, func, and_, or_, text, tuple_, union, intersect, except_
+from sqlalchemy.sql import Select, CompoundSelect, ColumnElement, Subquery
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.db.session import get_db
+from app.core.responses import PydanticResponse
+from app.db.session import async_session_maker, get_db
 from app.db.models.stock_pool import (
     StockPool, StockPoolMember, IndexConstituent, StockPoolCombination,
     PoolType, PredefinedPoolKey
@@ -21,6 +29,13 @@ from app.db.models.classification import StockStructuralInfo
 
 router = APIRouter()
 
+# combine_pools operation -> SQL set operator
+_SET_OPERATIONS = {
+    "union": union,
+    "intersection": intersect,
+    "difference": except_,
+}
+
 
 # ============================================
 # Pydantic Schemas
@@ -76,6 +91,7 @@ class PoolListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page")
 
 
 class StockPreview(BaseModel):
@@ -106,6 +122,107 @@ class PoolCombinationCreate(BaseModel):
     pool_ids: List[str]
 
 
+# ============================================
+# Predefined pool cache
+# ============================================
+# Predefined pools are whole-exchange / board lists that only change when
+# the daily metadata sync runs, so keep evaluated codes per process for a
+# few minutes instead of rescanning asset_meta on every request.
+
+PREDEFINED_POOL_CACHE_TTL_SECONDS = 300
+
+_predefined_pool_cache: Dict[tuple, Tuple[float, Tuple[str, ...]]] = {}
+
+
+def _predefined_cache_get(key: tuple) -> Optional[Tuple[str, ...]]:
+    """
+    Return cached codes for a predefined pool, or None if missing/expired.
+
+    Codes are stored as an immutable tuple since the entry is shared
+    between requests.
+    """
+    entry = _predefined_pool_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, codes = entry
+    if time.monotonic() >= expires_at:
+        _predefined_pool_cache.pop(key, None)
+        return None
+    return codes
+
+
+def _predefined_cache_set(key: tuple, codes: List[str]) -> None:
+    """Store evaluated codes for a predefined pool."""
+    _predefined_pool_cache[key] = (
+        time.monotonic() + PREDEFINED_POOL_CACHE_TTL_SECONDS,
+        tuple(codes),
+    )
+
+
+# ============================================
+# Predefined pool list cache
+# ============================================
+# /pools/predefined lists seeded system rows; keep the serialized body for
+# a minute so the hot path is a dict lookup. The version counter stops a
+# fill that raced with an invalidation from storing stale bytes.
+
+PREDEFINED_LIST_CACHE_TTL_SECONDS = 60
+
+# Rows per streamed list_pools chunk
+_POOL_STREAM_CHUNK = 100
+
+_predefined_list_cache: Optional[Tuple[float, bytes]] = None
+_predefined_list_version = 0
+_predefined_list_lock = asyncio.Lock()
+
+
+def _invalidate_predefined_list() -> None:
+    """Drop the cached /pools/predefined body."""
+    global _predefined_list_cache, _predefined_list_version
+    _predefined_list_cache = None
+    _predefined_list_version += 1
+
+
+# ============================================
+# Filter validation cache
+# ============================================
+# The pool editor re-validates the same expression on every edit. Market
+# data only changes on sync, so successful results are reused briefly,
+# keyed by the expression serialized with sorted keys.
+
+FILTER_VALIDATION_CACHE_TTL_SECONDS = 30
+FILTER_VALIDATION_CACHE_MAX_ENTRIES = 512
+
+_filter_validation_cache: Dict[bytes, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _filter_cache_key(filter_expression: Dict[str, Any]) -> bytes:
+    """Canonical key for a filter expression (key order insensitive)."""
+    return orjson.dumps(filter_expression, option=orjson.OPT_SORT_KEYS)
+
+
+def _filter_validation_cache_get(key: bytes) -> Optional[Dict[str, Any]]:
+    """Return a cached validation result, or None if missing/expired."""
+    entry = _filter_validation_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if time.monotonic() >= expires_at:
+        _filter_validation_cache.pop(key, None)
+        return None
+    return result
+
+
+def _filter_validation_cache_set(key: bytes, result: Dict[str, Any]) -> None:
+    """Store a validation result, evicting the oldest entry when full."""
+    if len(_filter_validation_cache) >= FILTER_VALIDATION_CACHE_MAX_ENTRIES:
+        _filter_validation_cache.pop(next(iter(_filter_validation_cache)), None)
+    _filter_validation_cache[key] = (
+        time.monotonic() + FILTER_VALIDATION_CACHE_TTL_SECONDS,
+        result,
+    )
+
+
 # ============================================
 # Pool Evaluator Service (inline for MVP)
 # ============================================
@@ -122,63 +239,78 @@ class PoolEvaluator:
         evaluation_date: Optional[date] = None
     ) -> List[str]:
         """Evaluate a pool and return stock codes."""
+        cache_key = None
         if pool.pool_type == PoolType.PREDEFINED.value:
-            return await self._evaluate_predefined(pool.predefined_key, evaluation_date)
+            cache_key = (pool.predefined_key, evaluation_date)
+            cached = _predefined_cache_get(cache_key)
+            if cached is not None:
+                # Each caller gets its own list to mutate freely
+                return list(cached)
+
+        result = await self.db.execute(self._pool_query(pool, evaluation_date))
+        codes = list(result.scalars().all())
+
+        if cache_key is not None:
+            _predefined_cache_set(cache_key, codes)
+        return codes
+
+    def _pool_query(
+        self,
+        pool: StockPool,
+        evaluation_date: Optional[date] = None
+    ) -> Select:
+        """Build the single-column SELECT that yields a pool's stock codes."""
+        if pool.pool_type == PoolType.PREDEFINED.value:
+            return self._predefined_query(pool.predefined_key, evaluation_date)
         elif pool.pool_type == PoolType.CUSTOM.value:
-            return await self._evaluate_custom(pool.id)
+            return self._custom_query(pool.id)
         elif pool.pool_type == PoolType.DYNAMIC.value:
-            return await self._evaluate_dynamic(pool.filter_expression, evaluation_date)
+            return self._dynamic_query(pool.filter_expression, evaluation_date)
         else:
             raise ValueError(f"Unknown pool type: {pool.pool_type}")
 
-    async def _evaluate_predefined(
+    @staticmethod
+    def _as_select(compound: CompoundSelect) -> Select:
+        """Wrap a UNION/INTERSECT/EXCEPT so it can be nested in another one."""
+        subq = compound.subquery()
+        return select(subq.c[0])
+
+    def _predefined_query(
         self,
         key: str,
         evaluation_date: Optional[date] = None
-    ) -> List[str]:
-        """Evaluate predefined pool."""
+    ) -> Select:
+        """Build query for a predefined pool."""
 
         if key == PredefinedPoolKey.SH_ALL.value:
-            query = select(AssetMeta.code).where(AssetMeta.exchange == "sh")
-            result = await self.db.execute(query)
-            return [r[0] for r in result.fetchall()]
+            return select(AssetMeta.code).where(AssetMeta.exchange == "sh")
 
         elif key == PredefinedPoolKey.SZ_ALL.value:
-            query = select(AssetMeta.code).where(AssetMeta.exchange == "sz")
-            result = await self.db.execute(query)
-            return [r[0] for r in result.fetchall()]
+            return select(AssetMeta.code).where(AssetMeta.exchange == "sz")
 
         elif key == PredefinedPoolKey.MAIN_BOARD.value:
             # Main board: use classification data
-            query = select(StockStructuralInfo.code).where(
+            return select(StockStructuralInfo.code).where(
                 StockStructuralInfo.board == "main"
             )
-            result = await self.db.execute(query)
-            return [r[0] for r in result.fetchall()]
 
         elif key == PredefinedPoolKey.GEM.value:
             # ChiNext (创业板): use classification data
-            query = select(StockStructuralInfo.code).where(
+            return select(StockStructuralInfo.code).where(
                 StockStructuralInfo.board == "gem"
             )
-            result = await self.db.execute(query)
-            return [r[0] for r in result.fetchall()]
 
         elif key == PredefinedPoolKey.STAR.value:
             # STAR Market (科创板): use classification data
-            query = select(StockStructuralInfo.code).where(
+            return select(StockStructuralInfo.code).where(
                 StockStructuralInfo.board == "star"
             )
-            result = await self.db.execute(query)
-            return [r[0] for r in result.fetchall()]
 
         elif key == PredefinedPoolKey.NON_ST.value:
             # Non-ST stocks: use classification data
-            query = select(StockStructuralInfo.code).where(
+            return select(StockStructuralInfo.code).where(
                 StockStructuralInfo.is_st == False
             )
-            result = await self.db.execute(query)
-            return [r[0] for r in result.fetchall()]
 
         # ETF pools
         elif key.startswith("etf_"):
@@ -191,147 +323,120 @@ class PoolEvaluator:
                 query = query.where(AssetMeta.exchange == "sz")
             # For etf_broad, etf_sector, etc. - filter by ETFProfile.fund_type
             # TODO: implement when ETF classification is in place
-            result = await self.db.execute(query)
-            return [r[0] for r in result.fetchall()]
+            return query
 
         raise ValueError(f"Unknown predefined key: {key}")
 
-    async def _evaluate_custom(self, pool_id: uuid.UUID) -> List[str]:
-        """Get custom pool members."""
-        query = select(StockPoolMember.stock_code).where(
+    def _custom_query(self, pool_id: uuid.UUID) -> Select:
+        """Build query for custom pool members."""
+        return select(StockPoolMember.stock_code).where(
             StockPoolMember.pool_id == pool_id
         )
-        result = await self.db.execute(query)
-        return [r[0] for r in result.fetchall()]
 
-    async def _evaluate_dynamic(
+    def _dynamic_query(
         self,
         filter_expr: Dict[str, Any],
         evaluation_date: Optional[date] = None
-    ) -> List[str]:
-        """Evaluate dynamic filter expression."""
+    ) -> Select:
+        """Build query for a dynamic filter expression."""
         if not filter_expr:
             # Return all stocks if no filter
-            query = select(AssetMeta.code)
-            result = await self.db.execute(query)
-            return [r[0] for r in result.fetchall()]
+            return select(AssetMeta.code)
 
         conditions = filter_expr.get("conditions", [])
         logic = filter_expr.get("logic", "AND")
 
         if not conditions:
-            query = select(AssetMeta.code)
-            result = await self.db.execute(query)
-            return [r[0] for r in result.fetchall()]
+            return select(AssetMeta.code)
 
-        # Build query dynamically
-        # Start with all stock codes
-        base_codes: Set[str] = set()
-
-        # Process each condition
-        condition_results = []
+        # Group condition expressions by source table so each table is
+        # scanned once with a combined WHERE clause.
+        asset_exprs = []
+        market_exprs = []
+        latest = None
         for cond in conditions:
             field = cond.get("field")
             operator = cond.get("operator")
             value = cond.get("value")
             table = cond.get("table", "daily_k_data")
 
-            codes = await self._evaluate_single_condition(field, operator, value, table)
-            condition_results.append(set(codes))
-
-        if not condition_results:
-            return []
+            if table == "asset_meta" or table == "stock_basic":
+                column = getattr(AssetMeta, field, None)
+                if column is None:
+                    raise ValueError(f"Unknown field: {field}")
+                asset_exprs.append(self._build_condition_expr(column, operator, value))
+
+            elif table == "market_daily" or table == "daily_k_data":
+                if getattr(MarketDaily, field, None) is None:
+                    raise ValueError(f"Unknown field: {field}")
+                if latest is None:
+                    latest = self._latest_market_subquery()
+                market_exprs.append(
+                    self._build_condition_expr(latest.c[field], operator, value)
+                )
 
-        # Combine results based on logic
-        if logic == "AND":
-            result_set = condition_results[0]
-            for s in condition_results[1:]:
-                result_set = result_set.intersection(s)
-        else:  # OR
-            result_set = condition_results[0]
-            for s in condition_results[1:]:
-                result_set = result_set.union(s)
+            else:
+                raise ValueError(f"Unknown table: {table}")
 
-        return list(result_set)
+        combine = and_ if logic == "AND" else or_
 
-    async def _evaluate_single_condition(
-        self,
-        field: str,
-        operator: str,
-        value: Any,
-        table: str
-    ) -> List[str]:
-        """Evaluate a single filter condition."""
-
-        if table == "asset_meta" or table == "stock_basic":
-            # Filter on asset_meta fields
-            column = getattr(AssetMeta, field, None)
-            if column is None:
-                raise ValueError(f"Unknown field: {field}")
-
-            query = select(AssetMeta.code)
-            query = self._apply_operator(query, column, operator, value)
-            result = await self.db.execute(query)
-            return [r[0] for r in result.fetchall()]
-
-        elif table == "market_daily" or table == "daily_k_data":
-            # Filter on latest market_daily
-            # Get latest date for each stock, then apply filter
-            column = getattr(MarketDaily, field, None)
-            if column is None:
-                raise ValueError(f"Unknown field: {field}")
-
-            # Subquery to get latest date per stock
-            latest_date_subq = (
-                select(
-                    MarketDaily.code,
-                    func.max(MarketDaily.date).label("max_date")
-                )
-                .group_by(MarketDaily.code)
-                .subquery()
+        table_queries = []
+        if asset_exprs:
+            table_queries.append(
+                select(AssetMeta.code).where(combine(*asset_exprs))
             )
-
-            # Main query joining with latest date
-            query = (
-                select(MarketDaily.code)
-                .join(
-                    latest_date_subq,
-                    and_(
-                        MarketDaily.code == latest_date_subq.c.code,
-                        MarketDaily.date == latest_date_subq.c.max_date
-                    )
-                )
+        if market_exprs:
+            table_queries.append(
+                select(latest.c.code).where(combine(*market_exprs))
             )
-            query = self._apply_operator(query, column, operator, value)
-            result = await self.db.execute(query)
-            return [r[0] for r in result.fetchall()]
 
-        raise ValueError(f"Unknown table: {table}")
+        if len(table_queries) == 1:
+            return table_queries[0]
+
+        if logic == "AND":
+            return self._as_select(intersect(*table_queries))
+        else:  # OR
+            return self._as_select(union(*table_queries))
+
+    def _latest_market_subquery(self) -> Subquery:
+        """Build subquery holding each stock's latest market_daily row."""
+        # DISTINCT ON walks idx_market_daily_code_date (code, date DESC)
+        # once instead of aggregating max(date) and joining back.
+        return (
+            select(MarketDaily)
+            .distinct(MarketDaily.code)
+            .order_by(MarketDaily.code, MarketDaily.date.desc())
+            .subquery()
+        )
 
-    def _apply_operator(self, query, column, operator: str, value: Any):
-        """Apply comparison operator to query."""
+    def _build_condition_expr(self, column, operator: str, value: Any) -> ColumnElement:
+        """Build the comparison expression for a single filter condition."""
         if operator == "lt":
-            return query.where(column < value)
+            return column < value
         elif operator == "lte":
-            return query.where(column <= value)
+            return column <= value
         elif operator == "gt":
-            return query.where(column > value)
+            return column > value
         elif operator == "gte":
-            return query.where(column >= value)
+            return column >= value
         elif operator == "eq":
-            return query.where(column == value)
+            return column == value
         elif operator == "neq":
-            return query.where(column != value)
+            return column != value
         elif operator == "in":
-            return query.where(column.in_(value))
+            return column.in_(value)
         elif operator == "not_in":
-            return query.where(~column.in_(value))
+            return ~column.in_(value)
         elif operator == "like":
-            return query.where(column.like(f"%{value}%"))
+            # Substring match; backed by a pg_trgm index on asset_meta.name
+            return column.like(f"%{value}%")
+        elif operator == "prefix":
+            # Anchored match, usable by plain btree indexes (e.g. code)
+            return column.like(f"{value}%")
         elif operator == "is_null":
-            return query.where(column.is_(None))
+            return column.is_(None)
         elif operator == "is_not_null":
-            return query.where(column.isnot(None))
+            return column.isnot(None)
         else:
             raise ValueError(f"Unknown operator: {operator}")
 
@@ -343,123 +448,301 @@ class PoolEvaluator:
     ) -> List[str]:
         """Combine multiple pools using set operations."""
 
-        all_codes: List[Set[str]] = []
-
-        for pool_id in pool_ids:
-            result = await self.db.execute(
-                select(StockPool).where(StockPool.id == pool_id)
-            )
-            pool = result.scalar_one_or_none()
-            if pool:
-                codes = await self.evaluate(pool, evaluation_date)
-                all_codes.append(set(codes))
+        set_op = _SET_OPERATIONS.get(operation)
+        if set_op is None:
+            raise ValueError(f"Unknown operation: {operation}")
 
-        if not all_codes:
+        if not pool_ids:
             return []
 
-        if operation == "union":
-            result_set = all_codes[0].union(*all_codes[1:])
-        elif operation == "intersection":
-            result_set = all_codes[0].intersection(*all_codes[1:])
-        elif operation == "difference":
-            result_set = all_codes[0].difference(*all_codes[1:])
-        else:
-            raise ValueError(f"Unknown operation: {operation}")
+        # One round-trip for all pools; keep the caller's order since
+        # difference is not commutative.
+        result = await self.db.execute(
+            select(StockPool).where(StockPool.id.in_(pool_ids))
+        )
+        pools_by_id = {p.id: p for p in result.scalars().all()}
+        queries = [
+            self._pool_query(pools_by_id[pid], evaluation_date)
+            for pid in pool_ids
+            if pid in pools_by_id
+        ]
+
+        if not queries:
+            return []
 
-        return list(result_set)
+        # Let Postgres do the set algebra so only the final codes cross the wire
+        combined = queries[0] if len(queries) == 1 else set_op(*queries)
+        result = await self.db.execute(combined)
+        return result.scalars().all()
 
 
 # ============================================
 # API Endpoints
 # ============================================
 
+# Above this many initial members, create_pool streams them with COPY
+MEMBER_COPY_THRESHOLD = 500
+
+
+async def _bulk_insert_members(
+    db: AsyncSession,
+    pool_id: uuid.UUID,
+    codes: List[str],
+) -> None:
+    """Insert pool members in bulk inside the session's transaction."""
+    if len(codes) < MEMBER_COPY_THRESHOLD:
+        # Core executemany -> batched multi-row INSERT (insertmanyvalues)
+        await db.execute(
+            insert(StockPoolMember),
+            [{"pool_id": pool_id, "stock_code": code} for code in codes],
+        )
+        return
+
+    # Large lists: COPY on the same asyncpg connection/transaction
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        StockPoolMember.__tablename__,
+        records=[(pool_id, code) for code in codes],
+        columns=["pool_id", "stock_code"],
+    )
+
+
+async def _rows_in_own_session(query) -> list:
+    """Run a query on a dedicated session so it can be gathered with db work."""
+    async with async_session_maker() as session:
+        result = await session.execute(query)
+        return result.all()
+
+
+# Columns PoolResponse needs; list/get paths select these instead of
+# hydrating full StockPool entities
+_POOL_COLUMNS = (
+    StockPool.id,
+    StockPool.name,
+    StockPool.description,
+    StockPool.pool_type,
+    StockPool.predefined_key,
+    StockPool.filter_expression,
+    StockPool.is_public,
+    StockPool.is_system,
+    StockPool.stock_count,
+    StockPool.last_evaluated_at,
+    StockPool.created_at,
+    StockPool.updated_at,
+)
+
+
+def _pool_response(pool: Any) -> PoolResponse:
+    """Build a PoolResponse from a loaded pool or _POOL_COLUMNS row without re-validating it."""
+    return PoolResponse.model_construct(
+        id=str(pool.id),
+        name=pool.name,
+        description=pool.description,
+        pool_type=pool.pool_type,
+        predefined_key=pool.predefined_key,
+        filter_expression=pool.filter_expression,
+        is_public=pool.is_public,
+        is_system=pool.is_system,
+        stock_count=pool.stock_count,
+        last_evaluated_at=pool.last_evaluated_at,
+        created_at=pool.created_at,
+        updated_at=pool.updated_at,
+    )
+
+
+def _pool_row(row: Row) -> Dict[str, Any]:
+    """
+    Build a PoolResponse-shaped dict for list bodies encoded with orjson.
+
+    Skips per-row model construction on the list paths; keys and
+    datetime format (OPT_UTC_Z) match PoolResponse's JSON output.
+    """
+    return {
+        "id": str(row.id),
+        "name": row.name,
+        "description": row.description,
+        "pool_type": row.pool_type,
+        "predefined_key": row.predefined_key,
+        "filter_expression": row.filter_expression,
+        "is_public": row.is_public,
+        "is_system": row.is_system,
+        "stock_count": row.stock_count,
+        "last_evaluated_at": row.last_evaluated_at,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+    }
+
+
+def _encode_pool_cursor(row: Row) -> str:
+    """Encode the (is_system, created_at, id) keyset position as an opaque cursor."""
+    raw = f"{int(row.is_system)}|{row.created_at.isoformat()}|{row.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_pool_cursor(cursor: str) -> Tuple[bool, datetime, uuid.UUID]:
+    """Decode a cursor produced by _encode_pool_cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        is_system, created_at, pool_id = raw.split("|", 2)
+        return bool(int(is_system)), datetime.fromisoformat(created_at), uuid.UUID(pool_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @router.get("", response_model=PoolListResponse)
 async def list_pools(
     pool_type: Optional[str] = Query(default=None, description="Filter by pool type"),
     include_system: bool = Query(default=True, description="Include system pools"),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(default=None, description="Keyset cursor (next_cursor of the previous page)"),
 ):
-    """List all stock pools."""
-    query = select(StockPool)
+    """
+    List all stock pools.
 
+    Pass `cursor` to seek past the previous page on
+    (is_system, created_at, id) instead of using `page`.
+    """
+    filters = []
     if pool_type:
-        query = query.where(StockPool.pool_type == pool_type)
+        filters.append(StockPool.pool_type == pool_type)
 
     if not include_system:
-        query = query.where(StockPool.is_system == False)
-
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Paginate
-    query = (
-        query
-        .order_by(StockPool.is_system.desc(), StockPool.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-    )
-
-    result = await db.execute(query)
-    pools = result.scalars().all()
-
-    return PoolListResponse(
-        items=[
-            PoolResponse(
-                id=str(p.id),
-                name=p.name,
-                description=p.description,
-                pool_type=p.pool_type,
-                predefined_key=p.predefined_key,
-                filter_expression=p.filter_expression,
-                is_public=p.is_public,
-                is_system=p.is_system,
-                stock_count=p.stock_count,
-                last_evaluated_at=p.last_evaluated_at,
-                created_at=p.created_at,
-                updated_at=p.updated_at,
+        filters.append(StockPool.is_system == False)
+
+    # Paginate (fetch one extra row to detect a next page)
+    order = (StockPool.is_system.desc(), StockPool.created_at.desc(), StockPool.id.desc())
+    if cursor:
+        # Seek pages select no window: COUNT(*) OVER () would make Postgres
+        # compute the whole filtered set before the keyset predicate, so
+        # the total is counted separately instead
+        cur_is_system, cur_created_at, cur_id = _decode_pool_cursor(cursor)
+        query = (
+            select(*_POOL_COLUMNS)
+            .where(
+                *filters,
+                tuple_(StockPool.is_system, StockPool.created_at, StockPool.id)
+                < tuple_(cur_is_system, cur_created_at, cur_id),
             )
-            for p in pools
-        ],
-        total=total,
-        page=page,
-        page_size=page_size,
+            .order_by(*order)
+            .limit(page_size + 1)
+        )
+    else:
+        # Offset pages: total rides along each row as COUNT(*) OVER (),
+        # computed over the filtered set before OFFSET/LIMIT narrows it
+        query = (
+            select(*_POOL_COLUMNS, func.count().over().label("total"))
+            .where(*filters)
+            .order_by(*order)
+            .offset((page - 1) * page_size)
+            .limit(page_size + 1)
+        )
+
+    count_query = select(func.count()).select_from(StockPool).where(*filters)
+
+    return StreamingResponse(
+        _stream_pool_list(query, count_query, page, page_size, bool(cursor)),
+        media_type="application/json",
     )
 
 
+async def _stream_pool_list(
+    query: Select,
+    count_query: Select,
+    page: int,
+    page_size: int,
+    seek: bool,
+) -> AsyncIterator[bytes]:
+    """
+    Emit a PoolListResponse JSON body chunk by chunk.
+
+    `query` yields _POOL_COLUMNS rows with one lookahead row past the page.
+    Offset pages also carry the total on each row; seek pages do not, and
+    their total is counted concurrently on a second session. Uses its own
+    session because the request-scoped one may already be closed by the
+    time the response body is consumed.
+    """
+    count_task = asyncio.create_task(_rows_in_own_session(count_query)) if seek else None
+    try:
+        yield b'{"items":['
+        count = 0
+        total = None
+        last = None
+        next_cursor = None
+        async with async_session_maker() as session:
+            result = await session.stream(query)
+            async for rows in result.partitions(_POOL_STREAM_CHUNK):
+                if total is None and not seek:
+                    total = rows[0].total
+                page_rows = rows[:page_size - count]
+                if page_rows:
+                    if count:
+                        yield b","
+                    yield orjson.dumps(
+                        [_pool_row(row) for row in page_rows],
+                        option=orjson.OPT_UTC_Z,
+                    )[1:-1]
+                    count += len(page_rows)
+                    last = page_rows[-1]
+                if len(page_rows) < len(rows):
+                    # Lookahead row present: more pools after this page
+                    next_cursor = _encode_pool_cursor(last)
+                    break
+
+            if total is None and not seek:
+                total = 0
+                if page > 1:
+                    # Past the end: no row carried the total, so count separately
+                    total = (await session.execute(count_query)).scalar() or 0
+
+        if count_task is not None:
+            total = (await count_task)[0][0]
+    finally:
+        if count_task is not None and not count_task.done():
+            count_task.cancel()
+
+    yield b"]," + orjson.dumps({
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "next_cursor": next_cursor,
+    })[1:]
+
+
 @router.get("/predefined", response_model=List[PoolResponse])
 async def list_predefined_pools(
     db: AsyncSession = Depends(get_db),
 ):
     """List all predefined (system) stock pools."""
-    query = select(StockPool).where(
-        StockPool.is_system == True,
-        StockPool.pool_type == PoolType.PREDEFINED.value
-    ).order_by(StockPool.name)
-
-    result = await db.execute(query)
-    pools = result.scalars().all()
-
-    return [
-        PoolResponse(
-            id=str(p.id),
-            name=p.name,
-            description=p.description,
-            pool_type=p.pool_type,
-            predefined_key=p.predefined_key,
-            filter_expression=p.filter_expression,
-            is_public=p.is_public,
-            is_system=p.is_system,
-            stock_count=p.stock_count,
-            last_evaluated_at=p.last_evaluated_at,
-            created_at=p.created_at,
-            updated_at=p.updated_at,
-        )
-        for p in pools
-    ]
+    global _predefined_list_cache
+
+    cached = _predefined_list_cache
+    if cached is not None and time.monotonic() < cached[0]:
+        return Response(content=cached[1], media_type="application/json")
+
+    # Serialize cold-start fills so concurrent requests don't all hit the DB
+    async with _predefined_list_lock:
+        cached = _predefined_list_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return Response(content=cached[1], media_type="application/json")
+
+        version = _predefined_list_version
+        query = select(*_POOL_COLUMNS).where(
+            StockPool.is_system == True,
+            StockPool.pool_type == PoolType.PREDEFINED.value
+        ).order_by(StockPool.name)
+
+        result = await db.execute(query)
+        body = orjson.dumps([_pool_row(row) for row in result], option=orjson.OPT_UTC_Z)
+
+        if version == _predefined_list_version:
+            _predefined_list_cache = (
+                time.monotonic() + PREDEFINED_LIST_CACHE_TTL_SECONDS,
+                body,
+            )
+
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("", response_model=PoolResponse, status_code=status.HTTP_201_CREATED)
@@ -490,79 +773,42 @@ async def create_pool(
 
     # If custom pool with initial stocks, add members
     if pool_in.pool_type == PoolType.CUSTOM.value and pool_in.stock_codes:
-        for code in pool_in.stock_codes:
-            member = StockPoolMember(pool_id=pool.id, stock_code=code)
-            db.add(member)
-        pool.stock_count = len(pool_in.stock_codes)
+        codes = list(dict.fromkeys(pool_in.stock_codes))
+        await _bulk_insert_members(db, pool.id, codes)
+        pool.stock_count = len(codes)
 
     await db.commit()
     await db.refresh(pool)
 
-    return PoolResponse(
-        id=str(pool.id),
-        name=pool.name,
-        description=pool.description,
-        pool_type=pool.pool_type,
-        predefined_key=pool.predefined_key,
-        filter_expression=pool.filter_expression,
-        is_public=pool.is_public,
-        is_system=pool.is_system,
-        stock_count=pool.stock_count,
-        last_evaluated_at=pool.last_evaluated_at,
-        created_at=pool.created_at,
-        updated_at=pool.updated_at,
-    )
+    return PydanticResponse(_pool_response(pool))
 
 
 @router.get("/{pool_id}", response_model=PoolResponse)
 async def get_pool(
-    pool_id: str,
+    pool_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Get a specific stock pool by ID."""
-    try:
-        pool_uuid = uuid.UUID(pool_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid pool ID format")
-
     result = await db.execute(
-        select(StockPool).where(StockPool.id == pool_uuid)
+        select(*_POOL_COLUMNS).where(StockPool.id == pool_id)
     )
-    pool = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not pool:
+    if not row:
         raise HTTPException(status_code=404, detail="Pool not found")
 
-    return PoolResponse(
-        id=str(pool.id),
-        name=pool.name,
-        description=pool.description,
-        pool_type=pool.pool_type,
-        predefined_key=pool.predefined_key,
-        filter_expression=pool.filter_expression,
-        is_public=pool.is_public,
-        is_system=pool.is_system,
-        stock_count=pool.stock_count,
-        last_evaluated_at=pool.last_evaluated_at,
-        created_at=pool.created_at,
-        updated_at=pool.updated_at,
-    )
+    return PydanticResponse(_pool_response(row))
 
 
 @router.get("/{pool_id}/preview", response_model=PoolPreviewResponse)
 async def preview_pool(
-    pool_id: str,
+    pool_id: uuid.UUID,
     limit: int = Query(default=100, ge=1, le=1000, description="Max stocks to return"),
     db: AsyncSession = Depends(get_db),
 ):
     """Preview pool contents (evaluate and return stocks)."""
-    try:
-        pool_uuid = uuid.UUID(pool_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid pool ID format")
-
     result = await db.execute(
-        select(StockPool).where(StockPool.id == pool_uuid)
+        select(StockPool).where(StockPool.id == pool_id)
     )
     pool = result.scalar_one_or_none()
 
@@ -577,28 +823,42 @@ async def preview_pool(
     pool.stock_count = len(stock_codes)
     pool.last_evaluated_at = datetime.utcnow()
     await db.commit()
+    if pool.is_system:
+        _invalidate_predefined_list()
 
     # Get stock details for preview
     limited_codes = stock_codes[:limit]
-    if limited_codes:
-        stocks_query = select(AssetMeta).where(AssetMeta.code.in_(limited_codes))
-        stocks_result = await db.execute(stocks_query)
-        stocks = stocks_result.scalars().all()
-    else:
-        stocks = []
-
-    # Calculate distributions
     exchange_dist: Dict[str, int] = {}
     asset_type_dist: Dict[str, int] = {}
 
-    for s in stocks:
-        ex = s.exchange or "unknown"
-        exchange_dist[ex] = exchange_dist.get(ex, 0) + 1
+    if limited_codes:
+        stocks_query = select(
+            AssetMeta.code, AssetMeta.name, AssetMeta.exchange
+        ).where(AssetMeta.code.in_(limited_codes))
+
+        # Distributions are counted in SQL rather than over fetched rows
+        # asset_type is NOT NULL; only exchange needs a fallback bucket
+        exchange = func.coalesce(AssetMeta.exchange, "unknown").label("exchange")
+        dist_query = (
+            select(exchange, AssetMeta.asset_type, func.count().label("n"))
+            .where(AssetMeta.code.in_(limited_codes))
+            .group_by(exchange, AssetMeta.asset_type)
+        )
+
+        stocks_result, dist_rows = await asyncio.gather(
+            db.execute(stocks_query),
+            _rows_in_own_session(dist_query),
+        )
+        stocks = stocks_result.all()
 
-        at = s.asset_type or "unknown"
-        asset_type_dist[at] = asset_type_dist.get(at, 0) + 1
+        for row in dist_rows:
+            exchange_dist[row.exchange] = exchange_dist.get(row.exchange, 0) + row.n
+            asset_type = row.asset_type.value
+            asset_type_dist[asset_type] = asset_type_dist.get(asset_type, 0) + row.n
+    else:
+        stocks = []
 
-    return PoolPreviewResponse(
+    return PydanticResponse(PoolPreviewResponse(
         pool_id=str(pool.id),
         pool_name=pool.name,
         stock_codes=stock_codes,
@@ -615,23 +875,18 @@ async def preview_pool(
         total_count=len(stock_codes),
         exchange_distribution=exchange_dist,
         sector_distribution=asset_type_dist,
-    )
+    ))
 
 
 @router.patch("/{pool_id}/members", response_model=PoolResponse)
 async def update_pool_members(
-    pool_id: str,
+    pool_id: uuid.UUID,
     members: PoolMemberUpdate,
     db: AsyncSession = Depends(get_db),
 ):
     """Update custom pool members (add/remove stocks)."""
-    try:
-        pool_uuid = uuid.UUID(pool_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid pool ID format")
-
     result = await db.execute(
-        select(StockPool).where(StockPool.id == pool_uuid)
+        select(StockPool).where(StockPool.id == pool_id)
     )
     pool = result.scalar_one_or_none()
 
@@ -644,79 +899,69 @@ async def update_pool_members(
             detail="Can only modify members of custom pools"
         )
 
-    # Add new members
+    # Add new members in one statement; existing (pool_id, stock_code)
+    # pairs are skipped by the primary key
     if members.add:
-        for code in members.add:
-            # Check if already exists
-            exists = await db.execute(
-                select(StockPoolMember).where(
-                    StockPoolMember.pool_id == pool_uuid,
-                    StockPoolMember.stock_code == code
-                )
-            )
-            if not exists.scalar_one_or_none():
-                db.add(StockPoolMember(pool_id=pool_uuid, stock_code=code))
+        await db.execute(
+            pg_insert(StockPoolMember)
+            .values([
+                {"pool_id": pool_id, "stock_code": code}
+                for code in dict.fromkeys(members.add)
+            ])
+            .on_conflict_do_nothing(index_elements=["pool_id", "stock_code"])
+        )
 
     # Remove members
     if members.remove:
         await db.execute(
             StockPoolMember.__table__.delete().where(
-                StockPoolMember.pool_id == pool_uuid,
+                StockPoolMember.pool_id == pool_id,
                 StockPoolMember.stock_code.in_(members.remove)
             )
         )
 
-    # Update count
-    count_result = await db.execute(
-        select(func.count()).where(StockPoolMember.pool_id == pool_uuid)
+    # Recount and reload the pool in one statement
+    result = await db.execute(
+        update(StockPool)
+        .where(StockPool.id == pool_id)
+        .values(
+            stock_count=select(func.count())
+            .select_from(StockPoolMember)
+            .where(StockPoolMember.pool_id == pool_id)
+            .scalar_subquery()
+        )
+        .returning(StockPool)
+        .execution_options(populate_existing=True)
     )
-    pool.stock_count = count_result.scalar() or 0
+    pool = result.scalar_one()
 
     await db.commit()
-    await db.refresh(pool)
 
-    return PoolResponse(
-        id=str(pool.id),
-        name=pool.name,
-        description=pool.description,
-        pool_type=pool.pool_type,
-        predefined_key=pool.predefined_key,
-        filter_expression=pool.filter_expression,
-        is_public=pool.is_public,
-        is_system=pool.is_system,
-        stock_count=pool.stock_count,
-        last_evaluated_at=pool.last_evaluated_at,
-        created_at=pool.created_at,
-        updated_at=pool.updated_at,
-    )
+    return PydanticResponse(_pool_response(pool))
 
 
 @router.delete("/{pool_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_pool(
-    pool_id: str,
+    pool_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a stock pool."""
-    try:
-        pool_uuid = uuid.UUID(pool_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid pool ID format")
-
     result = await db.execute(
-        select(StockPool).where(StockPool.id == pool_uuid)
+        select(StockPool.is_system).where(StockPool.id == pool_id)
     )
-    pool = result.scalar_one_or_none()
+    is_system = result.scalar_one_or_none()
 
-    if not pool:
+    if is_system is None:
         raise HTTPException(status_code=404, detail="Pool not found")
 
-    if pool.is_system:
+    if is_system:
         raise HTTPException(
             status_code=400,
             detail="Cannot delete system pools"
         )
 
-    await db.delete(pool)
+    # Members go with the pool via the FK's ON DELETE CASCADE
+    await db.execute(delete(StockPool).where(StockPool.id == pool_id))
     await db.commit()
 
 
@@ -726,6 +971,11 @@ async def validate_filter(
     db: AsyncSession = Depends(get_db),
 ):
     """Validate a filter expression without saving."""
+    cache_key = _filter_cache_key(filter_expression)
+    cached = _filter_validation_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         evaluator = PoolEvaluator(db)
         # Create a temporary pool-like object
@@ -734,11 +984,13 @@ async def validate_filter(
             filter_expression = filter_expression
 
         codes = await evaluator.evaluate(TempPool())
-        return {
+        result = {
             "valid": True,
             "stock_count": len(codes),
             "sample_codes": codes[:10]
         }
+        _filter_validation_cache_set(cache_key, result)
+        return result
     except Exception as e:
         return {
             "valid": False,
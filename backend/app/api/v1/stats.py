@@ -1,15 +1,20 @@
 """Dashboard statistics API endpoints."""
 
-from typing import Optional
+import asyncio
+import time
+from typing import Optional, Tuple
 from datetime import datetime
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Request
 from pydantic import BaseModel, Field
-from sqlalchemy import select, func, desc
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, desc, true
 
-from app.db.session import get_db
+from app.config import settings
+from app.core.response_cache import DASHBOARD_CACHE_NAMESPACE, cached_response
+from app.core.responses import PydanticResponse
+from app.db.session import async_session_maker
+from app.db.models.asset import AssetMeta
 from app.db.models.strategy import Strategy
 from app.db.models.backtest import BacktestJob, BacktestResult, BacktestStatus
 
@@ -67,166 +72,213 @@ class DashboardStats(BaseModel):
 # Temporary: Mock user ID until auth is implemented
 MOCK_USER_ID = "00000000-0000-0000-0000-000000000001"
 
+# asset_meta only changes on data sync (run by the worker), so a
+# minute-stale stock count is fine for the dashboard
+TOTAL_STOCKS_CACHE_TTL_SECONDS = 60
+
+_total_stocks_cache: Optional[Tuple[float, int]] = None
+
+
+# ============================================
+# Dashboard queries
+# ============================================
+# Everything is scoped to MOCK_USER_ID, so the statements are fixed and
+# built once at import instead of per request.
+
+# Strategy counts
+_strategy_stats = select(
+    func.count().label('total_strategies'),
+    func.count().filter(Strategy.is_active == True).label('active_strategies'),
+).select_from(Strategy).where(
+    Strategy.user_id == MOCK_USER_ID
+).subquery('strategy_stats')
+
+# Backtest counts
+_backtest_stats = select(
+    func.count().label('total_backtests'),
+    func.count().filter(BacktestJob.status == BacktestStatus.COMPLETED).label('completed_backtests'),
+    func.count().filter(BacktestJob.status == BacktestStatus.RUNNING).label('running_backtests'),
+).select_from(BacktestJob).where(
+    BacktestJob.user_id == MOCK_USER_ID
+).subquery('backtest_stats')
+
+# Best metrics from backtest results
+_result_stats = select(
+    func.max(BacktestResult.total_return).label('best_return'),
+    func.max(BacktestResult.sharpe_ratio).label('best_sharpe'),
+    func.avg(BacktestResult.sharpe_ratio).label('avg_sharpe'),
+).select_from(
+    BacktestResult
+).join(BacktestJob).where(
+    BacktestJob.user_id == MOCK_USER_ID,
+    BacktestResult.status == 'completed'
+).subquery('result_stats')
+
+# Each aggregate is exactly one row, so joining them ON true yields a
+# single row carrying every scalar
+_SUMMARY_QUERY = select(
+    _strategy_stats, _backtest_stats, _result_stats
+).select_from(
+    _strategy_stats
+    .join(_backtest_stats, true())
+    .join(_result_stats, true())
+)
+
+# Variant used when the cached stock count is cold: the global asset_meta
+# count rides along as one more single-row subquery
+_stock_stats = select(
+    func.count().label('total_stocks')
+).select_from(AssetMeta).subquery('stock_stats')
+_SUMMARY_WITH_STOCKS_QUERY = _SUMMARY_QUERY.add_columns(_stock_stats).join(_stock_stats, true())
+
+# Get top 3 strategies (by average return)
+_TOP_STRATEGIES_QUERY = (
+    select(
+        BacktestResult.strategy_id,
+        Strategy.name.label('strategy_name'),
+        Strategy.strategy_type,
+        func.avg(BacktestResult.total_return).label('avg_return'),
+        func.avg(BacktestResult.sharpe_ratio).label('avg_sharpe'),
+        func.count().label('backtest_count'),
+        func.avg(BacktestResult.win_rate).label('avg_win_rate'),
+    )
+    .join(BacktestJob, BacktestResult.job_id == BacktestJob.id)
+    # Inner join: results whose strategy was deleted are skipped
+    .join(Strategy, Strategy.id == BacktestResult.strategy_id)
+    .where(
+        BacktestJob.user_id == MOCK_USER_ID,
+        BacktestResult.status == 'completed',
+        BacktestResult.total_return.isnot(None),
+    )
+    .group_by(BacktestResult.strategy_id, Strategy.name, Strategy.strategy_type)
+    .order_by(desc('avg_return'))
+    .limit(3)
+)
+
+# Get top 3 backtests (by total return)
+_TOP_BACKTESTS_QUERY = (
+    select(
+        BacktestResult.id,
+        BacktestResult.stock_code,
+        BacktestResult.strategy_id,
+        Strategy.name.label('strategy_name'),
+        BacktestResult.total_return,
+        BacktestResult.annual_return,
+        BacktestResult.final_value,
+        BacktestResult.sharpe_ratio,
+        BacktestResult.max_drawdown,
+        BacktestResult.volatility,
+        BacktestResult.total_trades,
+        BacktestResult.win_rate,
+        BacktestResult.profit_factor,
+        BacktestResult.created_at,
+    )
+    .join(BacktestJob, BacktestResult.job_id == BacktestJob.id)
+    .outerjoin(Strategy, Strategy.id == BacktestResult.strategy_id)
+    .where(
+        BacktestJob.user_id == MOCK_USER_ID,
+        BacktestResult.status == 'completed',
+        BacktestResult.total_return.isnot(None),
+    )
+    .order_by(desc(BacktestResult.total_return))
+    .limit(3)
+)
+
 
 # ============================================
 # API Endpoints
 # ============================================
 
-@router.get("", response_model=DashboardStats, summary="Get Dashboard Statistics")
-async def get_dashboard_stats(
-    db: AsyncSession = Depends(get_db),
-):
+async def _fetch_rows(query) -> list:
     """
-    Get aggregated statistics for the dashboard.
+    Run a query on its own session and return all rows.
 
-    Returns counts and best metrics for strategies and backtests.
+    AsyncSession can't run overlapping statements, so each dashboard query
+    gets a session (and pooled connection) of its own to be gathered.
     """
-    # Strategy counts
-    total_strategies_query = select(func.count()).select_from(Strategy).where(
-        Strategy.user_id == MOCK_USER_ID
-    )
-    total_strategies_result = await db.execute(total_strategies_query)
-    total_strategies = total_strategies_result.scalar() or 0
+    async with async_session_maker() as session:
+        result = await session.execute(query)
+        return result.all()
 
-    active_strategies_query = select(func.count()).select_from(Strategy).where(
-        Strategy.user_id == MOCK_USER_ID,
-        Strategy.is_active == True
-    )
-    active_strategies_result = await db.execute(active_strategies_query)
-    active_strategies = active_strategies_result.scalar() or 0
 
-    # Backtest counts
-    total_backtests_query = select(func.count()).select_from(BacktestJob).where(
-        BacktestJob.user_id == MOCK_USER_ID
-    )
-    total_backtests_result = await db.execute(total_backtests_query)
-    total_backtests = total_backtests_result.scalar() or 0
+def _cached_total_stocks() -> Optional[int]:
+    """Return the cached asset_meta count, or None if missing/expired."""
+    cached = _total_stocks_cache
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+    return None
 
-    completed_backtests_query = select(func.count()).select_from(BacktestJob).where(
-        BacktestJob.user_id == MOCK_USER_ID,
-        BacktestJob.status == BacktestStatus.COMPLETED
-    )
-    completed_backtests_result = await db.execute(completed_backtests_query)
-    completed_backtests = completed_backtests_result.scalar() or 0
 
-    running_backtests_query = select(func.count()).select_from(BacktestJob).where(
-        BacktestJob.user_id == MOCK_USER_ID,
-        BacktestJob.status == BacktestStatus.RUNNING
-    )
-    running_backtests_result = await db.execute(running_backtests_query)
-    running_backtests = running_backtests_result.scalar() or 0
+def _set_total_stocks(total: int) -> None:
+    """Cache the asset_meta count for TOTAL_STOCKS_CACHE_TTL_SECONDS."""
+    global _total_stocks_cache
+    _total_stocks_cache = (time.monotonic() + TOTAL_STOCKS_CACHE_TTL_SECONDS, total)
 
-    # Best metrics from backtest results
-    best_return = None
-    best_sharpe = None
-    avg_sharpe = None
 
-    # Get best return
-    best_return_query = select(func.max(BacktestResult.total_return)).select_from(
-        BacktestResult
-    ).join(BacktestJob).where(
-        BacktestJob.user_id == MOCK_USER_ID,
-        BacktestResult.status == 'completed'
-    )
-    best_return_result = await db.execute(best_return_query)
-    best_return = best_return_result.scalar()
+@router.get("", response_model=DashboardStats, summary="Get Dashboard Statistics")
+@cached_response(
+    namespace=f"{DASHBOARD_CACHE_NAMESPACE}:{MOCK_USER_ID}",
+    expire=settings.dashboard_cache_ttl_seconds,
+)
+async def get_dashboard_stats(request: Request):
+    """
+    Get aggregated statistics for the dashboard.
 
-    # Get best Sharpe
-    best_sharpe_query = select(func.max(BacktestResult.sharpe_ratio)).select_from(
-        BacktestResult
-    ).join(BacktestJob).where(
-        BacktestJob.user_id == MOCK_USER_ID,
-        BacktestResult.status == 'completed'
+    Returns counts and best metrics for strategies and backtests. The
+    rendered body is cached in Redis per user for a few seconds so bursts
+    of page refreshes share one set of queries.
+    """
+    # The stock count is global and cached; only count when the cache is cold
+    total_stocks = _cached_total_stocks()
+    summary_query = _SUMMARY_QUERY if total_stocks is not None else _SUMMARY_WITH_STOCKS_QUERY
+
+    # The queries are independent: run them concurrently
+    (
+        summary_rows,
+        top_strategies_rows,
+        top_backtests_rows,
+    ) = await asyncio.gather(
+        _fetch_rows(summary_query),
+        _fetch_rows(_TOP_STRATEGIES_QUERY),
+        _fetch_rows(_TOP_BACKTESTS_QUERY),
     )
-    best_sharpe_result = await db.execute(best_sharpe_query)
-    best_sharpe = best_sharpe_result.scalar()
 
-    # Get average Sharpe
-    avg_sharpe_query = select(func.avg(BacktestResult.sharpe_ratio)).select_from(
-        BacktestResult
-    ).join(BacktestJob).where(
-        BacktestJob.user_id == MOCK_USER_ID,
-        BacktestResult.status == 'completed'
-    )
-    avg_sharpe_result = await db.execute(avg_sharpe_query)
-    avg_sharpe_value = avg_sharpe_result.scalar()
-    if avg_sharpe_value is not None:
-        avg_sharpe = Decimal(str(round(float(avg_sharpe_value), 4)))
-
-    # Get total stocks count
-    from app.db.models.asset import AssetMeta
-    total_stocks_query = select(func.count()).select_from(AssetMeta)
-    total_stocks_result = await db.execute(total_stocks_query)
-    total_stocks = total_stocks_result.scalar() or 0
-
-    # Get top 3 strategies (by average return)
-    top_strategies_list = []
-    top_strategies_query = (
-        select(
-            BacktestResult.strategy_id,
-            func.avg(BacktestResult.total_return).label('avg_return'),
-            func.avg(BacktestResult.sharpe_ratio).label('avg_sharpe'),
-            func.count().label('backtest_count'),
-            func.avg(BacktestResult.win_rate).label('avg_win_rate'),
-        )
-        .join(BacktestJob, BacktestResult.job_id == BacktestJob.id)
-        .where(
-            BacktestJob.user_id == MOCK_USER_ID,
-            BacktestResult.status == 'completed',
-            BacktestResult.total_return.isnot(None),
-        )
-        .group_by(BacktestResult.strategy_id)
-        .order_by(desc('avg_return'))
-        .limit(3)
-    )
-    top_strategies_result = await db.execute(top_strategies_query)
-    top_strategies_rows = top_strategies_result.all()
+    summary = summary_rows[0]
+    if total_stocks is None:
+        total_stocks = summary.total_stocks or 0
+        _set_total_stocks(total_stocks)
+    total_strategies = summary.total_strategies or 0
+    active_strategies = summary.active_strategies or 0
 
+    total_backtests = summary.total_backtests or 0
+    completed_backtests = summary.completed_backtests or 0
+    running_backtests = summary.running_backtests or 0
+
+    best_return = summary.best_return
+    best_sharpe = summary.best_sharpe
+    avg_sharpe = None
+    if summary.avg_sharpe is not None:
+        avg_sharpe = Decimal(str(round(float(summary.avg_sharpe), 4)))
+
+    top_strategies_list = []
     for row in top_strategies_rows:
-        # Get strategy details
-        strategy_query = select(Strategy).where(Strategy.id == row.strategy_id)
-        strategy_result = await db.execute(strategy_query)
-        strategy = strategy_result.scalar_one_or_none()
-
-        if strategy:
-            top_strategies_list.append(BestStrategy(
-                strategy_id=str(row.strategy_id),
-                strategy_name=strategy.name,
-                strategy_type=strategy.strategy_type,
-                avg_return=Decimal(str(round(float(row.avg_return), 6))),
-                avg_sharpe=Decimal(str(round(float(row.avg_sharpe), 4))) if row.avg_sharpe else None,
-                backtest_count=row.backtest_count,
-                avg_win_rate=Decimal(str(round(float(row.avg_win_rate), 4))) if row.avg_win_rate else None,
-            ))
-
-    # Get top 3 backtests (by total return)
-    top_backtests_list = []
-    top_backtests_query = (
-        select(BacktestResult)
-        .join(BacktestJob, BacktestResult.job_id == BacktestJob.id)
-        .where(
-            BacktestJob.user_id == MOCK_USER_ID,
-            BacktestResult.status == 'completed',
-            BacktestResult.total_return.isnot(None),
-        )
-        .order_by(desc(BacktestResult.total_return))
-        .limit(3)
-    )
-    top_backtests_result = await db.execute(top_backtests_query)
-    top_backtests_rows = top_backtests_result.scalars().all()
+        top_strategies_list.append(BestStrategy(
+            strategy_id=str(row.strategy_id),
+            strategy_name=row.strategy_name,
+            strategy_type=row.strategy_type,
+            avg_return=Decimal(str(round(float(row.avg_return), 6))),
+            avg_sharpe=Decimal(str(round(float(row.avg_sharpe), 4))) if row.avg_sharpe else None,
+            backtest_count=row.backtest_count,
+            avg_win_rate=Decimal(str(round(float(row.avg_win_rate), 4))) if row.avg_win_rate else None,
+        ))
 
+    top_backtests_list = []
     for row in top_backtests_rows:
-        # Get strategy name
-        strategy_query = select(Strategy).where(Strategy.id == row.strategy_id)
-        strategy_result = await db.execute(strategy_query)
-        strategy = strategy_result.scalar_one_or_none()
-        strategy_name = strategy.name if strategy else "Unknown"
-
         top_backtests_list.append(BestBacktest(
             result_id=str(row.id),
             stock_code=row.stock_code,
             strategy_id=str(row.strategy_id),
-            strategy_name=strategy_name,
+            strategy_name=row.strategy_name or "Unknown",
             total_return=row.total_return,
             annual_return=row.annual_return,
             final_value=row.final_value,
@@ -239,7 +291,7 @@ async def get_dashboard_stats(
             created_at=row.created_at,
         ))
 
-    return DashboardStats(
+    return PydanticResponse(DashboardStats(
         total_strategies=total_strategies,
         active_strategies=active_strategies,
         total_backtests=total_backtests,
@@ -251,4 +303,4 @@ async def get_dashboard_stats(
         total_stocks=total_stocks,
         top_strategies=top_strategies_list,
         top_backtests=top_backtests_list,
-    )
+    ))
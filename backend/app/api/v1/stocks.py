@@ -3,17 +3,31 @@
 Provides unified access to stocks and ETFs through the new data model.
 """
 
+import asyncio
+import hashlib
 from datetime import date
-from typing import List, Optional
+from typing import Any, AsyncIterator, List, Optional, Tuple
 from decimal import Decimal
 from enum import Enum
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from pydantic import BaseModel
-from sqlalchemy import select, func, and_, or_
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.db.session import get_db
+import orjson
+import redis.asyncio as redis
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import select, func, and_, or_, true
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.config import settings
+from app.core.response_cache import (
+    ASSETS_CACHE_NAMESPACE,
+    MARKET_DATA_GENERATION_KEY,
+    cached_response,
+    get_generation,
+)
+from app.core.responses import ORJSONResponse, PydanticResponse, etag_matches
+from app.db.session import async_session_maker, get_db
 from app.db.models.asset import AssetMeta, AssetType, MarketDaily, IndicatorValuation, IndicatorETF, AdjustFactor
 from app.db.models.profile import StockProfile, ETFProfile
 from app.db.models.indicator import TechnicalIndicator
@@ -184,6 +198,59 @@ class ETFIndicatorResponse(BaseModel):
     tracking_error: Optional[Decimal]
 
 
+# Validate whole ORM row lists (from_attributes) in one pydantic-core call
+_INDICATOR_LIST_ADAPTER = TypeAdapter(List[TechnicalIndicatorResponse])
+_ADJUST_FACTOR_LIST_ADAPTER = TypeAdapter(List[AdjustFactorResponse])
+
+# Columns each series endpoint serializes; selected as plain rows instead of
+# hydrating ORM entities
+_KLINE_COLUMNS = (
+    MarketDaily.date,
+    MarketDaily.open,
+    MarketDaily.high,
+    MarketDaily.low,
+    MarketDaily.close,
+    MarketDaily.volume,
+    MarketDaily.amount,
+    MarketDaily.pct_chg,
+    MarketDaily.turn,
+)
+
+_KLINE_FIELDS = tuple(column.key for column in _KLINE_COLUMNS)
+
+_INDICATOR_COLUMNS = (
+    TechnicalIndicator.date,
+    TechnicalIndicator.ma_5,
+    TechnicalIndicator.ma_10,
+    TechnicalIndicator.ma_20,
+    TechnicalIndicator.ma_60,
+    TechnicalIndicator.ema_12,
+    TechnicalIndicator.ema_26,
+    TechnicalIndicator.macd_dif,
+    TechnicalIndicator.macd_dea,
+    TechnicalIndicator.macd_hist,
+    TechnicalIndicator.rsi_6,
+    TechnicalIndicator.rsi_12,
+    TechnicalIndicator.rsi_24,
+    TechnicalIndicator.kdj_k,
+    TechnicalIndicator.kdj_d,
+    TechnicalIndicator.kdj_j,
+    TechnicalIndicator.boll_upper,
+    TechnicalIndicator.boll_middle,
+    TechnicalIndicator.boll_lower,
+)
+
+# Rows per streamed /kline chunk
+_KLINE_STREAM_CHUNK = 200
+
+_ADJUST_FACTOR_COLUMNS = (
+    AdjustFactor.divid_operate_date,
+    AdjustFactor.fore_adjust_factor,
+    AdjustFactor.back_adjust_factor,
+    AdjustFactor.adjust_factor,
+)
+
+
 # ============================================
 # Helper Functions
 # ============================================
@@ -203,12 +270,41 @@ def convert_to_stock_response(asset: AssetMeta, profile: Optional[StockProfile]
     )
 
 
+async def _page_total(db: AsyncSession, rows: list, filtered, page: int) -> int:
+    """
+    Total from the first row's windowed count.
+
+    Past the last page no row carries it, so count the filtered query
+    separately only then.
+    """
+    if rows:
+        return rows[0].total
+    if page == 1:
+        return 0
+    count_result = await db.execute(select(func.count()).select_from(filtered.subquery()))
+    return count_result.scalar() or 0
+
+
+async def _ensure_asset_exists(db: AsyncSession, code: str) -> None:
+    """Raise 404 if the asset code is unknown (used when a data query came back empty)."""
+    result = await db.execute(
+        select(select(AssetMeta.code).where(AssetMeta.code == code).exists())
+    )
+    if not result.scalar():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Asset not found",
+        )
+
+
 # ============================================
 # API Endpoints
 # ============================================
 
 @router.get("", response_model=StockListResponse)
+@cached_response(namespace=ASSETS_CACHE_NAMESPACE, expire=settings.assets_cache_ttl_seconds)
 async def list_stocks(
+    request: Request,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
     exchange: Optional[str] = Query(default=None, description="Filter by exchange: sh or sz"),
@@ -245,36 +341,36 @@ async def list_stocks(
             )
         )
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    # Total rides along each page row as COUNT(*) OVER (), computed over
+    # the filtered set before LIMIT/OFFSET narrows it. The profile (for
+    # industry) comes back on the same row via LEFT JOIN.
+    filtered = query
+    query = query.add_columns(
+        StockProfile,
+        func.count().over().label("total"),
+    ).outerjoin(StockProfile, StockProfile.code == AssetMeta.code)
 
     # Apply pagination
     query = query.offset((page - 1) * page_size).limit(page_size)
     query = query.order_by(AssetMeta.code)
 
     result = await db.execute(query)
-    assets = result.scalars().all()
-
-    # Get stock profiles for industry info
-    codes = [a.code for a in assets]
-    profile_result = await db.execute(
-        select(StockProfile).where(StockProfile.code.in_(codes))
-    )
-    profiles = {p.code: p for p in profile_result.scalars().all()}
+    rows = result.all()
+    total = await _page_total(db, rows, filtered, page)
 
-    return StockListResponse(
-        items=[convert_to_stock_response(a, profiles.get(a.code)) for a in assets],
+    return PydanticResponse(StockListResponse(
+        items=[convert_to_stock_response(row.AssetMeta, row.StockProfile) for row in rows],
         total=total,
         page=page,
         page_size=page_size,
         pages=(total + page_size - 1) // page_size,
-    )
+    ))
 
 
 @router.get("/assets", response_model=AssetListResponse)
+@cached_response(namespace=ASSETS_CACHE_NAMESPACE, expire=settings.assets_cache_ttl_seconds)
 async def list_assets(
+    request: Request,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
     exchange: Optional[str] = Query(default=None),
@@ -301,23 +397,25 @@ async def list_assets(
             )
         )
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    # Total rides along each page row as COUNT(*) OVER (), computed over
+    # the filtered set before LIMIT/OFFSET narrows it
+    filtered = query
+    query = query.add_columns(func.count().over().label("total"))
 
     # Apply pagination
     query = query.offset((page - 1) * page_size).limit(page_size)
     query = query.order_by(AssetMeta.code)
 
     result = await db.execute(query)
-    assets = result.scalars().all()
+    rows = result.all()
+    assets = [row.AssetMeta for row in rows]
+    total = await _page_total(db, rows, filtered, page)
 
-    return AssetListResponse(
+    return PydanticResponse(AssetListResponse(
         items=[AssetBasicResponse(
             code=a.code,
             name=a.name,
-            asset_type=a.asset_type.value if isinstance(a.asset_type, AssetType) else a.asset_type,
+            asset_type=a.asset_type.value,
             exchange=a.exchange,
             list_date=a.list_date,
             delist_date=a.delist_date,
@@ -328,18 +426,22 @@ async def list_assets(
         page=page,
         page_size=page_size,
         pages=(total + page_size - 1) // page_size,
-    )
+    ))
 
 
 @router.get("/search", response_model=List[AssetSearchResult])
+@cached_response(namespace=ASSETS_CACHE_NAMESPACE, expire=settings.assets_cache_ttl_seconds)
 async def search_assets(
+    request: Request,
     q: str = Query(min_length=1, description="Search query"),
     limit: int = Query(default=20, ge=1, le=50),
     asset_type: AssetTypeFilter = Query(default=AssetTypeFilter.ALL),
     db: AsyncSession = Depends(get_db),
 ):
-    """Search assets by code or name."""
-    query = select(AssetMeta).where(
+    """Search assets by code or name, best matches first."""
+    query = select(
+        AssetMeta.code, AssetMeta.name, AssetMeta.asset_type, AssetMeta.exchange,
+    ).where(
         or_(
             AssetMeta.code.ilike(f"%{q}%"),
             AssetMeta.name.ilike(f"%{q}%")
@@ -351,20 +453,29 @@ async def search_assets(
     elif asset_type == AssetTypeFilter.ETF:
         query = query.where(AssetMeta.asset_type == AssetType.ETF)
 
-    query = query.limit(limit)
+    # Matches come from the trigram indexes on code/name; rank prefix hits
+    # first, then by trigram similarity, so the limit keeps the best ones
+    query = query.order_by(
+        or_(AssetMeta.code.ilike(f"{q}%"), AssetMeta.name.ilike(f"{q}%")).desc(),
+        func.greatest(
+            func.similarity(AssetMeta.code, q),
+            func.similarity(AssetMeta.name, q),
+        ).desc(),
+        AssetMeta.code,
+    ).limit(limit)
 
     result = await db.execute(query)
-    assets = result.scalars().all()
-
-    return [
-        AssetSearchResult(
-            code=a.code,
-            name=a.name,
-            asset_type=a.asset_type.value if isinstance(a.asset_type, AssetType) else a.asset_type,
-            exchange=a.exchange,
-        )
+    assets = result.all()
+
+    return ORJSONResponse([
+        {
+            "code": a.code,
+            "name": a.name,
+            "asset_type": a.asset_type.value,
+            "exchange": a.exchange,
+        }
         for a in assets
-    ]
+    ])
 
 
 @router.get("/{code}", response_model=StockBasicResponse)
@@ -373,73 +484,175 @@ async def get_stock(
     db: AsyncSession = Depends(get_db),
 ):
     """Get asset basic information by code."""
+    # Profile (for industry info) comes back on the same row
     result = await db.execute(
-        select(AssetMeta).where(AssetMeta.code == code)
+        select(AssetMeta, StockProfile)
+        .outerjoin(StockProfile, StockProfile.code == AssetMeta.code)
+        .where(AssetMeta.code == code)
     )
-    asset = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not asset:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Asset not found",
         )
 
-    # Get profile for industry info
-    profile_result = await db.execute(
-        select(StockProfile).where(StockProfile.code == code)
-    )
-    profile = profile_result.scalar_one_or_none()
-
-    return convert_to_stock_response(asset, profile)
+    return convert_to_stock_response(row.AssetMeta, row.StockProfile)
 
 
 @router.get("/{code}/kline", response_model=KLineResponse)
 async def get_kline(
+    request: Request,
     code: str,
     start_date: Optional[date] = Query(default=None),
     end_date: Optional[date] = Query(default=None),
     limit: int = Query(default=250, ge=1, le=1000),
-    db: AsyncSession = Depends(get_db),
 ):
-    """Get K-line (OHLCV) data for an asset."""
-    # Get asset info
-    asset_result = await db.execute(
-        select(AssetMeta).where(AssetMeta.code == code)
+    """
+    Get K-line (OHLCV) data for an asset.
+
+    The body is streamed in chronological order as rows arrive. Sends an
+    ETag; revalidations with a matching If-None-Match get 304 without
+    reading the bars.
+    """
+    # Asset name LEFT JOIN market_daily: no row means unknown asset, a
+    # single row with no bar means no data in range
+    join_on = [MarketDaily.code == AssetMeta.code]
+    if start_date:
+        join_on.append(MarketDaily.date >= start_date)
+    if end_date:
+        join_on.append(MarketDaily.date <= end_date)
+
+    # Latest `limit` bars, re-sorted oldest first in SQL
+    latest = (
+        select(AssetMeta.name, *_KLINE_COLUMNS)
+        .select_from(AssetMeta)
+        .outerjoin(MarketDaily, and_(*join_on))
+        .where(AssetMeta.code == code)
+        .order_by(MarketDaily.date.desc())
+        .limit(limit)
+        .subquery()
     )
-    asset = asset_result.scalar_one_or_none()
-
-    if not asset:
+    query = select(latest).order_by(latest.c.date.asc())
+
+    # Own session: the body outlives the request-scoped one. Read the
+    # first chunk up front so an unknown code is still a plain 404.
+    session = async_session_maker()
+    try:
+        if request.headers.get("if-none-match"):
+            # Revalidation: the fingerprint decides whether bars are read
+            etag = await _kline_etag(code, start_date, end_date, limit)
+            if etag is not None and etag_matches(request, etag):
+                await session.close()
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+            result, first = await _open_kline_stream(session, query)
+        else:
+            # Nothing to revalidate: fingerprint and first chunk run
+            # concurrently on separate sessions. Let both settle before
+            # raising, so the session is never closed mid-query.
+            etag, opened = await asyncio.gather(
+                _kline_etag(code, start_date, end_date, limit),
+                _open_kline_stream(session, query),
+                return_exceptions=True,
+            )
+            for outcome in (etag, opened):
+                if isinstance(outcome, BaseException):
+                    raise outcome
+            result, first = opened
+    except BaseException:
+        await session.close()
+        raise
+
+    if not first:
+        await session.close()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Asset not found",
         )
 
-    # Build K-line query from market_daily
-    query = select(MarketDaily).where(MarketDaily.code == code)
+    return StreamingResponse(
+        _stream_kline(session, result, first, code),
+        media_type="application/json",
+        headers={"ETag": etag} if etag is not None else None,
+    )
+
+
+async def _open_kline_stream(session: AsyncSession, query) -> Tuple[AsyncResult, list]:
+    """Start streaming a kline query and read its first chunk."""
+    result = await session.stream(query)
+    return result, await result.fetchmany(_KLINE_STREAM_CHUNK)
+
 
+async def _kline_etag(
+    code: str,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    limit: int,
+) -> Optional[str]:
+    """
+    Fingerprint of a kline response: request params, the latest bar date
+    and bar count in range (read from the (code, date) primary key), and
+    the market data generation, which imports bump so restated bars on
+    existing dates change the tag too. Runs on its own session so it can
+    overlap the bar query.
+
+    Returns None when the generation can't be read; the response is then
+    sent without an ETag rather than risking a stale 304.
+    """
+    try:
+        generation = await get_generation(MARKET_DATA_GENERATION_KEY)
+    except redis.RedisError:
+        return None
+
+    query = select(func.max(MarketDaily.date), func.count()).where(MarketDaily.code == code)
     if start_date:
         query = query.where(MarketDaily.date >= start_date)
     if end_date:
         query = query.where(MarketDaily.date <= end_date)
+    async with async_session_maker() as session:
+        max_date, bar_count = (await session.execute(query)).one()
+    fingerprint = f"{code}|{start_date}|{end_date}|{limit}|{max_date}|{bar_count}|{generation}"
+    return '"' + hashlib.blake2b(fingerprint.encode(), digest_size=8).hexdigest() + '"'
 
-    query = query.order_by(MarketDaily.date.desc()).limit(limit)
 
-    result = await db.execute(query)
-    kline_data = result.scalars().all()
+def _decimal_to_str(value: Any) -> str:
+    """orjson fallback for Decimal columns, matching pydantic's JSON output."""
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
 
-    # Reverse to get chronological order
-    kline_data = list(reversed(kline_data))
 
-    return KLineResponse(
-        code=code,
-        code_name=asset.name,
-        data=[KLineData.model_validate(k) for k in kline_data],
-        total=len(kline_data),
-    )
+async def _stream_kline(
+    session: AsyncSession,
+    result: AsyncResult,
+    first: list,
+    code: str,
+) -> AsyncIterator[bytes]:
+    """Emit a KLineResponse JSON body chunk by chunk, then close the session."""
+    try:
+        yield b'{"code":' + orjson.dumps(code) + b',"code_name":' + orjson.dumps(first[0].name) + b',"data":['
+        total = 0
+        chunk = first
+        while chunk:
+            # Rows are (name, *_KLINE_COLUMNS); encode the bars as KLineData
+            # dicts directly, with decimals as strings like pydantic does
+            bars = [dict(zip(_KLINE_FIELDS, row[1:])) for row in chunk if row.date is not None]
+            if bars:
+                if total:
+                    yield b","
+                yield orjson.dumps(bars, default=_decimal_to_str)[1:-1]
+                total += len(bars)
+            chunk = await result.fetchmany(_KLINE_STREAM_CHUNK)
+        yield b'],"total":' + str(total).encode() + b"}"
+    finally:
+        await session.close()
 
 
 @router.get("/{code}/indicators", response_model=List[TechnicalIndicatorResponse])
+@cached_response(namespace=ASSETS_CACHE_NAMESPACE, expire=settings.asset_detail_cache_ttl_seconds)
 async def get_indicators(
+    request: Request,
     code: str,
     start_date: Optional[date] = Query(default=None),
     end_date: Optional[date] = Query(default=None),
@@ -447,62 +660,72 @@ async def get_indicators(
     db: AsyncSession = Depends(get_db),
 ):
     """Get technical indicators for an asset."""
-    # Check asset exists
-    asset_result = await db.execute(
-        select(AssetMeta).where(AssetMeta.code == code)
-    )
-    if not asset_result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Asset not found",
-        )
-
     # Build query
-    query = select(TechnicalIndicator).where(TechnicalIndicator.code == code)
+    query = select(*_INDICATOR_COLUMNS).where(TechnicalIndicator.code == code)
 
     if start_date:
         query = query.where(TechnicalIndicator.date >= start_date)
     if end_date:
         query = query.where(TechnicalIndicator.date <= end_date)
 
-    query = query.order_by(TechnicalIndicator.date.desc()).limit(limit)
+    # Latest `limit` rows, re-sorted oldest first in SQL
+    latest = query.order_by(TechnicalIndicator.date.desc()).limit(limit).subquery()
+    query = select(latest).order_by(latest.c.date.asc())
 
     result = await db.execute(query)
-    indicators = result.scalars().all()
-
-    # Reverse to get chronological order
-    indicators = list(reversed(indicators))
+    indicators = result.all()
+    if not indicators:
+        await _ensure_asset_exists(db, code)
 
-    return [TechnicalIndicatorResponse.model_validate(i) for i in indicators]
+    items = _INDICATOR_LIST_ADAPTER.validate_python(indicators, from_attributes=True)
+    return Response(content=_INDICATOR_LIST_ADAPTER.dump_json(items), media_type="application/json")
 
 
 @router.get("/{code}/fundamentals")
+@cached_response(namespace=ASSETS_CACHE_NAMESPACE, expire=settings.asset_detail_cache_ttl_seconds)
 async def get_fundamentals(
+    request: Request,
     code: str,
     db: AsyncSession = Depends(get_db),
 ):
     """Get fundamental/valuation data for an asset."""
-    # Check asset exists and get type
-    asset_result = await db.execute(
-        select(AssetMeta).where(AssetMeta.code == code)
+    # Asset type plus the latest valuation / ETF indicator row, each
+    # fetched by a LATERAL top-1 join so it is a single round trip
+    latest_valuation = aliased(
+        IndicatorValuation,
+        select(IndicatorValuation)
+        .where(IndicatorValuation.code == AssetMeta.code)
+        .order_by(IndicatorValuation.date.desc())
+        .limit(1)
+        .lateral(),
     )
-    asset = asset_result.scalar_one_or_none()
+    latest_etf = aliased(
+        IndicatorETF,
+        select(IndicatorETF)
+        .where(IndicatorETF.code == AssetMeta.code)
+        .order_by(IndicatorETF.date.desc())
+        .limit(1)
+        .lateral(),
+    )
+    result = await db.execute(
+        select(AssetMeta.asset_type, latest_valuation, latest_etf)
+        .select_from(AssetMeta)
+        .outerjoin(latest_valuation, true())
+        .outerjoin(latest_etf, true())
+        .where(AssetMeta.code == code)
+    )
+    row = result.one_or_none()
 
-    if not asset:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Asset not found",
         )
+    asset_type, valuation, etf_indicator = row
 
     # For stocks, get valuation data
-    if asset.asset_type == AssetType.STOCK or asset.asset_type == "STOCK":
-        result = await db.execute(
-            select(IndicatorValuation)
-            .where(IndicatorValuation.code == code)
-            .order_by(IndicatorValuation.date.desc())
-            .limit(1)
-        )
-        latest = result.scalar_one_or_none()
+    if asset_type == AssetType.STOCK:
+        latest = valuation
 
         if not latest:
             raise HTTPException(
@@ -510,7 +733,7 @@ async def get_fundamentals(
                 detail="Fundamental data not found",
             )
 
-        return {
+        return ORJSONResponse({
             "code": code,
             "asset_type": "STOCK",
             "date": latest.date,
@@ -521,21 +744,15 @@ async def get_fundamentals(
             "total_mv": latest.total_mv,
             "circ_mv": latest.circ_mv,
             "is_st": latest.is_st,
-        }
+        })
 
     # For ETFs, get ETF-specific indicators
-    elif asset.asset_type == AssetType.ETF or asset.asset_type == "ETF":
-        result = await db.execute(
-            select(IndicatorETF)
-            .where(IndicatorETF.code == code)
-            .order_by(IndicatorETF.date.desc())
-            .limit(1)
-        )
-        latest = result.scalar_one_or_none()
+    elif asset_type == AssetType.ETF:
+        latest = etf_indicator
 
         # ETFs may not have indicator data
         if latest:
-            return {
+            return ORJSONResponse({
                 "code": code,
                 "asset_type": "ETF",
                 "date": latest.date,
@@ -543,10 +760,10 @@ async def get_fundamentals(
                 "discount_rate": latest.discount_rate,
                 "unit_total": latest.unit_total,
                 "tracking_error": latest.tracking_error,
-            }
+            })
         else:
             # Return empty response for ETF without indicator data
-            return {
+            return ORJSONResponse({
                 "code": code,
                 "asset_type": "ETF",
                 "date": None,
@@ -554,7 +771,7 @@ async def get_fundamentals(
                 "discount_rate": None,
                 "unit_total": None,
                 "tracking_error": None,
-            }
+            })
 
     else:
         raise HTTPException(
@@ -572,33 +789,25 @@ async def get_adjust_factors(
     db: AsyncSession = Depends(get_db),
 ):
     """Get adjustment factors for an asset."""
-    # Check asset exists
-    asset_result = await db.execute(
-        select(AssetMeta).where(AssetMeta.code == code)
-    )
-    if not asset_result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Asset not found",
-        )
-
     # Build query
-    query = select(AdjustFactor).where(AdjustFactor.code == code)
+    query = select(*_ADJUST_FACTOR_COLUMNS).where(AdjustFactor.code == code)
 
     if start_date:
         query = query.where(AdjustFactor.divid_operate_date >= start_date)
     if end_date:
         query = query.where(AdjustFactor.divid_operate_date <= end_date)
 
-    query = query.order_by(AdjustFactor.divid_operate_date.desc()).limit(limit)
+    # Latest `limit` rows, re-sorted oldest first in SQL
+    latest = query.order_by(AdjustFactor.divid_operate_date.desc()).limit(limit).subquery()
+    query = select(latest).order_by(latest.c.divid_operate_date.asc())
 
     result = await db.execute(query)
-    factors = result.scalars().all()
+    factors = result.all()
+    if not factors:
+        await _ensure_asset_exists(db, code)
 
-    # Reverse to get chronological order
-    factors = list(reversed(factors))
-
-    return [AdjustFactorResponse.model_validate(f) for f in factors]
+    items = _ADJUST_FACTOR_LIST_ADAPTER.validate_python(factors, from_attributes=True)
+    return Response(content=_ADJUST_FACTOR_LIST_ADAPTER.dump_json(items), media_type="application/json")
 
 
 @router.get("/{code}/profile")
@@ -607,22 +816,27 @@ async def get_asset_profile(
     db: AsyncSession = Depends(get_db),
 ):
     """Get detailed profile for an asset (stock or ETF)."""
-    # Get asset
-    asset_result = await db.execute(
-        select(AssetMeta).where(AssetMeta.code == code)
+    # Get asset with both profile tables joined; only the one matching
+    # its type will have a row
+    result = await db.execute(
+        select(AssetMeta, StockProfile, ETFProfile)
+        .outerjoin(StockProfile, StockProfile.code == AssetMeta.code)
+        .outerjoin(ETFProfile, ETFProfile.code == AssetMeta.code)
+        .where(AssetMeta.code == code)
     )
-    asset = asset_result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not asset:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Asset not found",
         )
 
+    asset = row.AssetMeta
     base_info = {
         "code": asset.code,
         "name": asset.name,
-        "asset_type": asset.asset_type.value if isinstance(asset.asset_type, AssetType) else asset.asset_type,
+        "asset_type": asset.asset_type.value,
         "exchange": asset.exchange,
         "list_date": asset.list_date,
         "delist_date": asset.delist_date,
@@ -631,11 +845,8 @@ async def get_asset_profile(
     }
 
     # Get type-specific profile
-    if asset.asset_type == AssetType.STOCK or asset.asset_type == "STOCK":
-        profile_result = await db.execute(
-            select(StockProfile).where(StockProfile.code == code)
-        )
-        profile = profile_result.scalar_one_or_none()
+    if asset.asset_type == AssetType.STOCK:
+        profile = row.StockProfile
 
         if profile:
             base_info.update({
@@ -648,11 +859,8 @@ async def get_asset_profile(
                 "float_shares": profile.float_shares,
             })
 
-    elif asset.asset_type == AssetType.ETF or asset.asset_type == "ETF":
-        profile_result = await db.execute(
-            select(ETFProfile).where(ETFProfile.code == code)
-        )
-        profile = profile_result.scalar_one_or_none()
+    elif asset.asset_type == AssetType.ETF:
+        profile = row.ETFProfile
 
         if profile:
             base_info.update({
@@ -665,4 +873,4 @@ async def get_asset_profile(
                 "fund_size": profile.fund_size,
             })
 
-    return base_info
+    return ORJSONResponse(base_info)
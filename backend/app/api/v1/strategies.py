@@ -1,15 +1,18 @@
 """Strategy management API endpoints."""
 
 import hashlib
+import re
 from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from pydantic import BaseModel, Field
-from sqlalchemy import select, func
+from fastapi.responses import Response
+from pydantic import BaseModel, Field, TypeAdapter
+from sqlalchemy import func, insert, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.responses import PydanticResponse
 from app.db.session import get_db
 from app.db.models.strategy import Strategy
 from app.domain.engine import StrategyLoader, STRATEGY_TEMPLATES
@@ -104,6 +107,11 @@ def compute_code_hash(code: str) -> str:
     return hashlib.sha256(code.encode()).hexdigest()
 
 
+# StrategyResponse fields, selected as columns by list_strategies
+_STRATEGY_FIELDS = tuple(StrategyResponse.model_fields)
+_STRATEGY_COLUMNS = tuple(getattr(Strategy, name) for name in _STRATEGY_FIELDS)
+
+
 # Temporary: Mock user ID until auth is implemented
 MOCK_USER_ID = "00000000-0000-0000-0000-000000000001"
 
@@ -123,7 +131,7 @@ async def list_strategies(
 ):
     """List all strategies for the current user with pagination and filtering."""
     # Build query
-    query = select(Strategy).where(Strategy.user_id == MOCK_USER_ID)
+    query = select(*_STRATEGY_COLUMNS).where(Strategy.user_id == MOCK_USER_ID)
 
     # Apply filters
     if strategy_type:
@@ -135,10 +143,10 @@ async def list_strategies(
             Strategy.name.ilike(f"%{search}%") | Strategy.description.ilike(f"%{search}%")
         )
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    # Total rides along each page row as COUNT(*) OVER (), computed over
+    # the filtered set before LIMIT/OFFSET narrows it
+    filtered = query
+    query = query.add_columns(func.count().over().label("total"))
 
     # Apply pagination
     query = query.offset((page - 1) * page_size).limit(page_size)
@@ -146,15 +154,30 @@ async def list_strategies(
 
     # Execute query
     result = await db.execute(query)
-    strategies = result.scalars().all()
-
-    return StrategyListResponse(
-        items=[StrategyResponse.model_validate(s) for s in strategies],
+    rows = result.all()
+
+    if rows:
+        total = rows[0].total
+    elif page > 1:
+        # Past the end: no row carried the total, so count separately
+        count_result = await db.execute(select(func.count()).select_from(filtered.subquery()))
+        total = count_result.scalar() or 0
+    else:
+        total = 0
+
+    # Rows come straight from our own columns, so skip re-validation
+    items = [
+        StrategyResponse.model_construct(**dict(zip(_STRATEGY_FIELDS, row)))
+        for row in rows
+    ]
+
+    return PydanticResponse(StrategyListResponse.model_construct(
+        items=items,
         total=total,
         page=page,
         page_size=page_size,
         pages=(total + page_size - 1) // page_size,
-    )
+    ))
 
 
 @router.post("", response_model=StrategyResponse, status_code=status.HTTP_201_CREATED)
@@ -315,34 +338,48 @@ async def clone_strategy(
     db: AsyncSession = Depends(get_db),
 ):
     """Clone an existing strategy."""
+    # Copy the source row server-side in one INSERT ... SELECT; code and
+    # parameters never leave the database. Column defaults (id, version,
+    # flags) are filled in by from_select.
+    copied = select(
+        literal(MOCK_USER_ID, Strategy.user_id.type),
+        literal(new_name, Strategy.name.type),
+        literal("Cloned from: ") + Strategy.name,
+        Strategy.strategy_type,
+        Strategy.code,
+        Strategy.code_hash,
+        Strategy.parameters,
+        Strategy.indicators_used,
+    ).where(Strategy.id == strategy_id)
+
     result = await db.execute(
-        select(Strategy).where(Strategy.id == strategy_id)
+        insert(Strategy)
+        .from_select(
+            [
+                "user_id",
+                "name",
+                "description",
+                "strategy_type",
+                "code",
+                "code_hash",
+                "parameters",
+                "indicators_used",
+            ],
+            copied,
+        )
+        .returning(*_STRATEGY_COLUMNS)
     )
-    source = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not source:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Strategy not found",
         )
 
-    # Create clone
-    clone = Strategy(
-        user_id=MOCK_USER_ID,
-        name=new_name,
-        description=f"Cloned from: {source.name}",
-        strategy_type=source.strategy_type,
-        code=source.code,
-        code_hash=source.code_hash,
-        parameters=source.parameters,
-        indicators_used=source.indicators_used,
-    )
-
-    db.add(clone)
     await db.commit()
-    await db.refresh(clone)
 
-    return StrategyResponse.model_validate(clone)
+    return PydanticResponse(StrategyResponse.model_construct(**dict(zip(_STRATEGY_FIELDS, row))))
 
 
 class StrategyTemplateResponse(BaseModel):
@@ -352,26 +389,32 @@ class StrategyTemplateResponse(BaseModel):
     code: str
 
 
+_TEMPLATE_DOC_RE = re.compile(r'"""(.*?)"""', re.S)
+
+
+def _template_description(code: str) -> str:
+    """First line of the template class docstring."""
+    match = _TEMPLATE_DOC_RE.search(code)
+    if not match:
+        return ""
+    return match.group(1).strip().split("\n", 1)[0].strip()
+
+
+# Templates are static, so the listing is rendered to JSON once at import
+_TEMPLATES_BODY = TypeAdapter(List[StrategyTemplateResponse]).dump_json([
+    StrategyTemplateResponse(
+        name=name,
+        description=_template_description(code),
+        code=code.strip(),
+    )
+    for name, code in STRATEGY_TEMPLATES.items()
+])
+
+
 @router.get("/templates/list", response_model=List[StrategyTemplateResponse])
 async def list_strategy_templates():
     """Get list of available strategy templates."""
-    templates = []
-    for name, code in STRATEGY_TEMPLATES.items():
-        # Extract description from docstring
-        desc = ""
-        lines = code.strip().split('\n')
-        for line in lines:
-            if '"""' in line:
-                desc = line.replace('"""', '').strip()
-                break
-
-        templates.append(StrategyTemplateResponse(
-            name=name,
-            description=desc,
-            code=code.strip(),
-        ))
-
-    return templates
+    return Response(content=_TEMPLATES_BODY, media_type="application/json")
 
 
 class ValidateCodeRequest(BaseModel):
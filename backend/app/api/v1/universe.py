@@ -473,7 +473,7 @@ async def get_universe_snapshot(
         items.append(UniverseAssetItem(
             code=row.code,
             name=row.name,
-            asset_type=row.asset_type.value if isinstance(row.asset_type, AssetType) else row.asset_type,
+            asset_type=row.asset_type.value,
             exchange=row.exchange,
             price=row.price,
             change_pct=row.change_pct,
@@ -856,7 +856,7 @@ async def get_asset_detail(
     response = UniverseAssetDetail(
         code=asset.code,
         name=asset.name,
-        asset_type=asset.asset_type.value if isinstance(asset.asset_type, AssetType) else asset.asset_type,
+        asset_type=asset.asset_type.value,
         exchange=asset.exchange,
         list_date=asset.list_date,
 
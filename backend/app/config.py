@@ -24,7 +24,14 @@ class Settings(BaseSettings):
     # Database
     database_url: str
     database_pool_size: int = 20
-    database_max_overflow: int = 10
+    database_max_overflow: int = 40  # dashboard/list endpoints gather several sessions per request
+    database_pool_recycle_seconds: int = 1800
+    database_pool_timeout_seconds: int = 5  # fail fast instead of queueing behind a drained pool
+    database_pool_pre_ping: bool = False  # pool_recycle already retires connections before server idle timeouts
+    database_pgbouncer: bool = False  # behind pgbouncer transaction pooling: no client pool, no prepared statements
+    database_statement_cache_size: int = 256  # asyncpg prepared statements per connection
+    database_asyncpg_statement_cache_size: int = 1024  # asyncpg's own LRU of parsed statements
+    database_jit: bool = False  # PG JIT compile time outweighs its gain on short API queries
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
@@ -48,6 +55,21 @@ class Settings(BaseSettings):
             return json.loads(v)
         return v
 
+    # Redis response cache for slow-changing read endpoints (seconds)
+    response_cache_ttl_seconds: int = 300
+
+    # Asset list/search responses; also purged when a data sync finishes
+    assets_cache_ttl_seconds: int = 60
+
+    # Per-asset daily data (indicators, fundamentals); changes only on sync
+    asset_detail_cache_ttl_seconds: int = 3600
+
+    # Dashboard stats change with every backtest; only absorb refresh bursts
+    dashboard_cache_ttl_seconds: int = 3
+
+    # Response compression (bytes; smaller bodies are sent uncompressed)
+    gzip_minimum_size: int = 1024
+
     # Rate limiting
     api_rate_limit_per_minute: int = 100
 
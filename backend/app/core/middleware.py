@@ -0,0 +1,35 @@
+"""ASGI middleware."""
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+def _is_event_stream(scope: Scope) -> bool:
+    """Whether a request is for a Server-Sent Events stream."""
+    if scope["path"].endswith("/events"):
+        return True
+    for name, value in scope["headers"]:
+        if name == b"accept":
+            return b"text/event-stream" in value
+    return False
+
+
+class EventStreamAwareGZipMiddleware:
+    """
+    GZipMiddleware that leaves Server-Sent Events streams uncompressed.
+
+    Older Starlette releases compress text/event-stream like any other body,
+    buffering events until the compressor flushes, so progress updates
+    stall. SSE requests (the /events routes, or Accept: text/event-stream)
+    bypass compression here.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500) -> None:
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and _is_event_stream(scope):
+            await self.app(scope, receive, send)
+            return
+        await self.gzip(scope, receive, send)
@@ -0,0 +1,175 @@
+"""Redis read-through cache for JSON GET endpoints."""
+
+import functools
+import logging
+from typing import Any, Awaitable, Callable, Optional
+from urllib.parse import urlencode
+
+import orjson
+import redis.asyncio as redis
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Key layout: cache:<namespace>:<path>?<sorted query>
+CACHE_KEY_PREFIX = "cache"
+
+# /indices responses; invalidated when index compositions are recomputed
+INDICES_CACHE_NAMESPACE = "indices"
+
+# /stocks list, search and per-asset detail responses; invalidated when a
+# data sync completes
+ASSETS_CACHE_NAMESPACE = "assets"
+
+# /stats dashboard, suffixed with the user id; expires on a short TTL
+DASHBOARD_CACHE_NAMESPACE = "dashboard"
+
+# Counter bumped after every market data import. /kline folds it into its
+# ETag, so bars restated on dates already present still change the tag.
+MARKET_DATA_GENERATION_KEY = "generation:market_daily"
+
+_cache_client: Optional[redis.Redis] = None
+
+
+def get_cache_client() -> redis.Redis:
+    """Get or create the shared Redis client used for cached responses."""
+    global _cache_client
+    if _cache_client is None:
+        _cache_client = redis.from_url(settings.redis_url)
+    return _cache_client
+
+
+async def close_cache_client() -> None:
+    """Close the shared response cache client."""
+    global _cache_client
+    if _cache_client is not None:
+        await _cache_client.aclose()
+        _cache_client = None
+
+
+def _cache_key(namespace: str, request: Request) -> str:
+    """Build a cache key from path and order-insensitive query params."""
+    query = urlencode(sorted(request.query_params.multi_items()))
+    return f"{CACHE_KEY_PREFIX}:{namespace}:{request.url.path}?{query}"
+
+
+def _pack_response(response: Response) -> bytes:
+    """
+    Serialize a response as `<headers JSON>\n<body>` for storage.
+
+    Content-Length is dropped; it is recomputed from the body on replay.
+    orjson never emits a raw newline, so the first one ends the headers.
+    """
+    headers = [
+        [name, value]
+        for name, value in response.headers.items()
+        if name != "content-length"
+    ]
+    return orjson.dumps(headers) + b"\n" + response.body
+
+
+def _unpack_response(packed: bytes) -> Optional[Response]:
+    """Rebuild a response stored by _pack_response; None if unreadable."""
+    raw_headers, sep, body = packed.partition(b"\n")
+    if not sep:
+        return None
+    try:
+        headers = orjson.loads(raw_headers)
+    except orjson.JSONDecodeError:
+        return None
+    response = Response(content=body)
+    for name, value in headers:
+        response.headers.append(name, value)
+    return response
+
+
+def cached_response(
+    namespace: str,
+    expire: Optional[int] = None,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Cache an endpoint's JSON body in Redis, keyed by path + query params.
+
+    The endpoint must accept a `request: Request` parameter and return a
+    Response (e.g. PydanticResponse / ORJSONResponse) so the rendered body
+    can be stored as-is, together with the headers the endpoint set (ETag,
+    Cache-Control, ...), which are replayed on hits. StreamingResponse has
+    no rendered body and is rejected with a TypeError. Only 200 responses
+    are cached; errors raised as HTTPException pass straight through.
+    Redis failures are logged and the endpoint is served uncached.
+    """
+    ttl = expire if expire is not None else settings.response_cache_ttl_seconds
+
+    def decorator(endpoint: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            request: Request = kwargs["request"]
+            key = _cache_key(namespace, request)
+            client = get_cache_client()
+
+            try:
+                packed = await client.get(key)
+            except redis.RedisError as e:
+                logger.warning(f"Response cache read failed for {key}: {e}")
+                packed = None
+            if packed is not None:
+                cached = _unpack_response(packed)
+                if cached is not None:
+                    return cached
+
+            response = await endpoint(*args, **kwargs)
+
+            if isinstance(response, StreamingResponse):
+                raise TypeError(
+                    f"cached_response cannot cache {endpoint.__name__}: "
+                    "StreamingResponse bodies are not rendered up front"
+                )
+            if isinstance(response, Response) and response.status_code == 200:
+                try:
+                    await client.set(key, _pack_response(response), ex=ttl)
+                except redis.RedisError as e:
+                    logger.warning(f"Response cache write failed for {key}: {e}")
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+async def invalidate_namespace(namespace: str) -> int:
+    """
+    Delete every cached response in a namespace. Returns keys removed.
+
+    Uses a short-lived client so it is safe to call from workers and CLI
+    scripts that run their own event loops.
+    """
+    client = redis.from_url(settings.redis_url)
+    try:
+        keys = [key async for key in client.scan_iter(match=f"{CACHE_KEY_PREFIX}:{namespace}:*")]
+        if not keys:
+            return 0
+        return await client.delete(*keys)
+    finally:
+        await client.aclose()
+
+
+async def get_generation(key: str) -> int:
+    """Read a generation counter (0 if never bumped). Raises redis.RedisError."""
+    value = await get_cache_client().get(key)
+    return int(value) if value is not None else 0
+
+
+async def bump_generation(key: str) -> int:
+    """
+    Increment a generation counter. Returns the new value.
+
+    Uses a short-lived client, like invalidate_namespace.
+    """
+    client = redis.from_url(settings.redis_url)
+    try:
+        return await client.incr(key)
+    finally:
+        await client.aclose()
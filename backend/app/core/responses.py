@@ -0,0 +1,64 @@
+"""Custom response classes."""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi import Request
+from fastapi.responses import ORJSONResponse as _FastAPIORJSONResponse
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [c.strip().removeprefix("W/") for c in header.split(",")]
+    return etag in candidates or "*" in candidates
+
+
+class PydanticResponse(Response):
+    """
+    JSON response that serializes a pydantic model with pydantic-core.
+
+    Returning a Response instance skips FastAPI's `serialize_response`
+    re-validation against `response_model`, so endpoints that already
+    built the exact response type pay for serialization only once.
+    Keep `response_model=` on the route for the OpenAPI schema.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if content is None:
+            return b"null"
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+        raise TypeError(f"PydanticResponse expects a pydantic model, got {type(content).__name__}")
+
+
+def _orjson_default(value: Any) -> Any:
+    """Encode types orjson lacks the way FastAPI's jsonable_encoder does."""
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONResponse(_FastAPIORJSONResponse):
+    """
+    orjson response that also encodes Decimal (as int/float, like
+    jsonable_encoder does).
+
+    Endpoints returning dicts of raw column values can return this
+    directly instead of a plain dict, skipping jsonable_encoder's
+    recursive walk. Used as the app's default response class.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
@@ -5,7 +5,10 @@ from decimal import Decimal
 from typing import Optional
 from enum import Enum
 
-from sqlalchemy import String, Integer, Date, DateTime, Numeric, BigInteger, Index, func, PrimaryKeyConstraint
+from sqlalchemy import (
+    String, Integer, Date, DateTime, Numeric, BigInteger, Index, func, PrimaryKeyConstraint,
+    Enum as SQLEnum,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -41,7 +44,10 @@ class AssetMeta(Base):
 
     code: Mapped[str] = mapped_column(String(20), primary_key=True)  # "sh.600000", "sh.510050"
     name: Mapped[str] = mapped_column(String(100), nullable=False)
-    asset_type: Mapped[AssetType] = mapped_column(String(20), nullable=False)
+    # Stored as the plain VARCHAR(20) value; loads as AssetType members
+    asset_type: Mapped[AssetType] = mapped_column(
+        SQLEnum(AssetType, native_enum=False, length=20), nullable=False
+    )
     exchange: Mapped[str] = mapped_column(String(10), nullable=False)  # sh/sz/bj
     list_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     delist_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
@@ -60,8 +66,25 @@ class AssetMeta(Base):
 
     __table_args__ = (
         Index("idx_asset_meta_type", "asset_type"),
+        Index("idx_asset_meta_type_code", "asset_type", "code"),
         Index("idx_asset_meta_exchange", "exchange"),
+        # /stocks listings: type + exchange filter, ordered by code
+        Index("idx_asset_meta_type_exchange_code", "asset_type", "exchange", "code"),
         Index("idx_asset_meta_status", "status"),
+        # pg_trgm GIN index so unanchored LIKE '%...%' on name can use an index
+        Index(
+            "idx_asset_meta_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        # Same for code, so code-or-name search can BitmapOr both indexes
+        Index(
+            "idx_asset_meta_code_trgm",
+            "code",
+            postgresql_using="gin",
+            postgresql_ops={"code": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
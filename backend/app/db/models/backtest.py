@@ -8,7 +8,7 @@ from enum import Enum
 
 from sqlalchemy import (
     String, Text, Integer, Date, DateTime, Numeric,
-    ForeignKey, Index, PrimaryKeyConstraint, func, Enum as SQLEnum
+    ForeignKey, Index, PrimaryKeyConstraint, func, text, Enum as SQLEnum
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship, WriteOnlyMapped
@@ -137,6 +137,8 @@ class BacktestJob(Base):
         Index("idx_backtest_jobs_user", "user_id"),
         Index("idx_backtest_jobs_status", "status"),
         Index("idx_backtest_jobs_created", "created_at"),
+        # Per-user status counts on the dashboard (index-only)
+        Index("idx_backtest_jobs_user_status", "user_id", "status"),
     )
 
     def __repr__(self) -> str:
@@ -234,6 +236,14 @@ class BacktestResult(Base):
         Index("idx_backtest_results_strategy", "strategy_id"),
         Index("idx_backtest_results_stock", "stock_code"),
         Index("idx_backtest_results_sharpe", "sharpe_ratio"),
+        # Dashboard top backtests: status = ... ORDER BY total_return DESC LIMIT n
+        Index(
+            "idx_backtest_results_status_return",
+            "status",
+            "total_return",
+            postgresql_ops={"total_return": "DESC"},
+            postgresql_where=text("total_return IS NOT NULL"),
+        ),
         Index(
             "idx_backtest_results_job_strategy_stock",
             "job_id", "strategy_id", "stock_code",
@@ -4,7 +4,10 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional, List
 
-from sqlalchemy import String, Date, DateTime, Numeric, BigInteger, Index, ForeignKey, func
+from sqlalchemy import (
+    String, Date, DateTime, Numeric, BigInteger, Float, Index, ForeignKey, func,
+    Column, MetaData, Table,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -177,3 +180,15 @@ class IndexProfile(Base):
 
     def __repr__(self) -> str:
         return f"<IndexProfile(code={self.code}, type={self.index_type})>"
+
+
+# Materialized view over index_profile.industry_composition->'sw_l1'
+# (one row per index/industry). Created and owned by migration f6a7b8c9d0e1,
+# so it lives on its own MetaData to stay out of create_all/autogenerate.
+index_industry_sw_l1 = Table(
+    "index_industry_sw_l1",
+    MetaData(),
+    Column("code", String(20), primary_key=True),
+    Column("industry", String(50), primary_key=True),
+    Column("weight", Float),
+)
@@ -8,7 +8,7 @@ from enum import Enum
 
 from sqlalchemy import (
     String, Text, Integer, Date, DateTime, Numeric, Boolean,
-    ForeignKey, Index, PrimaryKeyConstraint, func, CheckConstraint
+    ForeignKey, Index, PrimaryKeyConstraint, func, CheckConstraint, text
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -101,7 +101,8 @@ class StockPool(Base):
 
     # Relationships
     members: Mapped[List["StockPoolMember"]] = relationship(
-        "StockPoolMember", back_populates="pool", cascade="all, delete-orphan"
+        "StockPoolMember", back_populates="pool", cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     __table_args__ = (
@@ -109,6 +110,14 @@ class StockPool(Base):
         Index("idx_stock_pools_type", "pool_type"),
         Index("idx_stock_pools_predefined", "predefined_key"),
         Index("idx_stock_pools_public", "is_public"),
+        # Keyset pagination for list_pools
+        Index(
+            "idx_stock_pools_listing",
+            "is_system",
+            "created_at",
+            "id",
+            postgresql_ops={"is_system": "DESC", "created_at": "DESC", "id": "DESC"},
+        ),
         CheckConstraint(
             "pool_type IN ('predefined', 'custom', 'dynamic')",
             name="valid_pool_type"
@@ -173,6 +182,15 @@ class IndexConstituent(Base):
         Index("idx_constituents_index", "index_code"),
         Index("idx_constituents_stock", "stock_code"),
         Index("idx_constituents_effective", "effective_date"),
+        # Current constituents of an index by weight, index-only for /constituents
+        Index(
+            "idx_constituents_current_weight",
+            "index_code",
+            "weight",
+            postgresql_ops={"weight": "DESC"},
+            postgresql_include=["stock_code", "effective_date"],
+            postgresql_where=text("expire_date IS NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
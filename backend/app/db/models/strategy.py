@@ -73,6 +73,13 @@ class Strategy(Base):
 
     __table_args__ = (
         Index("idx_strategies_user", "user_id"),
+        # Strategy list: user_id = ... ORDER BY updated_at DESC LIMIT n
+        Index(
+            "idx_strategies_user_updated",
+            "user_id",
+            "updated_at",
+            postgresql_ops={"updated_at": "DESC"},
+        ),
         Index("idx_strategies_type", "strategy_type"),
         Index("idx_strategies_active", "is_active"),
         Index("idx_strategies_user_name_version", "user_id", "name", "version", unique=True),
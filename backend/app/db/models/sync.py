@@ -1,16 +1,20 @@
 """Data sync tracking models."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import String, DateTime, Numeric, Integer, Text, Index, func
+from sqlalchemy import String, DateTime, Numeric, Integer, Text, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
 
+# 运行超过该时长的同步任务视为卡死 (与 api_triggered_sync 的 60 分钟超时一致)
+SYNC_STALE_THRESHOLD_MINUTES = 60
+SYNC_STALE_THRESHOLD = timedelta(minutes=SYNC_STALE_THRESHOLD_MINUTES)
+
 
 class SyncHistory(Base):
     """
@@ -67,7 +71,29 @@ class SyncHistory(Base):
     )
 
     __table_args__ = (
-        Index("idx_sync_history_started_at", "started_at", postgresql_ops={"started_at": "DESC"}),
+        # Covering index: /status, /history and keyset pagination are index-only scans
+        Index(
+            "idx_sync_history_started_at_covering",
+            "started_at",
+            "id",
+            postgresql_ops={"started_at": "DESC", "id": "DESC"},
+            postgresql_include=[
+                "status",
+                "sync_type",
+                "completed_at",
+                "duration_seconds",
+                "records_downloaded",
+                "records_imported",
+                "records_classified",
+            ],
+        ),
+        # Partial index: /active only ever sees 0-1 queued/running rows
+        Index(
+            "idx_sync_history_active",
+            "started_at",
+            postgresql_ops={"started_at": "DESC"},
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
         Index("idx_sync_history_status", "status"),
         Index("idx_sync_history_type", "sync_type"),
     )
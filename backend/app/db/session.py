@@ -1,17 +1,47 @@
 """Database session management."""
 
 from typing import AsyncGenerator
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.config import settings
 
+if settings.database_pgbouncer:
+    # pgbouncer owns pooling, and prepared statements do not survive its
+    # transaction-mode connection swaps: no statement caches, and unique
+    # statement names so two clients never collide on one server
+    # connection. No server_settings either; pgbouncer rejects unknown
+    # startup parameters such as jit unless ignore_startup_parameters
+    # lists them.
+    _engine_args = {
+        "poolclass": NullPool,
+        "connect_args": {
+            "prepared_statement_cache_size": 0,
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        },
+    }
+else:
+    _engine_args = {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout_seconds,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+        "pool_recycle": settings.database_pool_recycle_seconds,
+        "connect_args": {
+            "prepared_statement_cache_size": settings.database_statement_cache_size,
+            "statement_cache_size": settings.database_asyncpg_statement_cache_size,
+            "server_settings": {"jit": "on" if settings.database_jit else "off"},
+        },
+    }
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
-    pool_size=settings.database_pool_size,
-    max_overflow=settings.database_max_overflow,
     echo=settings.debug,
+    **_engine_args,
 )
 
 # Create async session factory
@@ -5,10 +5,12 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import ORJSONResponse
 
 from app.config import settings
-from app.db.session import close_db, init_db
+from app.core.middleware import EventStreamAwareGZipMiddleware
+from app.core.response_cache import close_cache_client
+from app.core.responses import ORJSONResponse
+from app.db.session import close_db, engine, init_db
 from app.api.v1.router import api_router
 
 
@@ -19,6 +21,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await init_db()
     yield
     # Shutdown
+    await close_cache_client()
     await close_db()
 
 
@@ -42,14 +45,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (index compositions, constituent lists, ...);
+# SSE streams are left uncompressed so events are not buffered
+app.add_middleware(EventStreamAwareGZipMiddleware, minimum_size=settings.gzip_minimum_size)
+
 # Include API router
 app.include_router(api_router, prefix=settings.api_v1_prefix)
 
 
 @app.get("/health", tags=["Health"])
 async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "version": "1.0.0"}
+    """Health check endpoint, including connection pool usage."""
+    return {"status": "healthy", "version": "1.0.0", "db_pool": engine.pool.status()}
 
 
 @app.get("/", tags=["Root"])
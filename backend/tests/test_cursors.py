@@ -0,0 +1,75 @@
+"""Tests for the opaque keyset cursors used by list endpoints."""
+
+import base64
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.data_sync import _decode_history_cursor, _encode_history_cursor
+from app.api.v1.indices import _decode_index_cursor, _encode_index_cursor
+from app.api.v1.pools import _decode_pool_cursor, _encode_pool_cursor
+
+
+def _b64(raw: str) -> str:
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def test_history_cursor_round_trip():
+    started_at = datetime(2026, 10, 18, 9, 30, 15, 123456, tzinfo=timezone.utc)
+    job_id = "sync-20261018-0930"
+
+    cursor = _encode_history_cursor(started_at, job_id)
+
+    assert _decode_history_cursor(cursor) == (started_at, job_id)
+
+
+def test_history_cursor_keeps_separator_in_id():
+    started_at = datetime(2026, 10, 18, 9, 30)
+
+    cursor = _encode_history_cursor(started_at, "a|b")
+
+    assert _decode_history_cursor(cursor) == (started_at, "a|b")
+
+
+def test_pool_cursor_round_trip():
+    row = SimpleNamespace(
+        is_system=True,
+        created_at=datetime(2026, 10, 18, 10, 0, tzinfo=timezone.utc),
+        id=uuid.uuid4(),
+    )
+
+    cursor = _encode_pool_cursor(row)
+
+    assert _decode_pool_cursor(cursor) == (True, row.created_at, row.id)
+
+
+def test_index_cursor_round_trip():
+    cursor = _encode_index_cursor("000300.SH")
+
+    assert _decode_index_cursor(cursor) == "000300.SH"
+
+
+@pytest.mark.parametrize(
+    "decode, cursor",
+    [
+        (_decode_history_cursor, "not base64!"),
+        (_decode_history_cursor, _b64("no-separator")),
+        (_decode_history_cursor, _b64("not-a-date|job")),
+        (_decode_pool_cursor, "not base64!"),
+        (_decode_pool_cursor, _b64("1|2026-10-18T10:00:00")),
+        (_decode_pool_cursor, _b64("x|2026-10-18T10:00:00|" + str(uuid.uuid4()))),
+        (_decode_pool_cursor, _b64("1|2026-10-18T10:00:00|not-a-uuid")),
+        (_decode_index_cursor, "not base64!"),
+        (_decode_index_cursor, ""),
+        (_decode_index_cursor, base64.urlsafe_b64encode(b"\xff\xfe").decode()),
+    ],
+)
+def test_invalid_cursor_is_rejected_with_400(decode, cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode(cursor)
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == "Invalid cursor"
@@ -0,0 +1,166 @@
+"""Tests for the Redis response cache."""
+
+import fnmatch
+
+import orjson
+import pytest
+from fastapi.responses import Response, StreamingResponse
+from starlette.requests import Request
+
+from app.core import response_cache
+from app.core.responses import ORJSONResponse
+
+
+class FakeRedis:
+    """In-memory stand-in for the subset of redis.asyncio.Redis used here."""
+
+    def __init__(self, data=None):
+        self.data = dict(data or {})
+        self.closed = False
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def scan_iter(self, match):
+        for key in list(self.data):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    async def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            if self.data.pop(key, None) is not None:
+                removed += 1
+        return removed
+
+    async def aclose(self):
+        self.closed = True
+
+
+def _request(path, query_string=b""):
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": query_string,
+            "headers": [],
+        }
+    )
+
+
+def test_cache_key_ignores_query_param_order():
+    a = response_cache._cache_key("assets", _request("/api/v1/stocks", b"page=2&asset_type=stock"))
+    b = response_cache._cache_key("assets", _request("/api/v1/stocks", b"asset_type=stock&page=2"))
+
+    assert a == b == "cache:assets:/api/v1/stocks?asset_type=stock&page=2"
+
+
+def test_cache_key_keeps_repeated_params_and_namespace():
+    key = response_cache._cache_key("indices", _request("/api/v1/indices", b"code=b&code=a"))
+
+    assert key == "cache:indices:/api/v1/indices?code=a&code=b"
+    assert key != response_cache._cache_key("assets", _request("/api/v1/indices", b"code=b&code=a"))
+
+
+def test_cache_key_without_query():
+    key = response_cache._cache_key("indices", _request("/api/v1/indices"))
+
+    assert key == "cache:indices:/api/v1/indices?"
+
+
+def test_pack_unpack_round_trip():
+    response = ORJSONResponse({"a": 1}, headers={"ETag": '"abc"', "Cache-Control": "no-cache"})
+
+    restored = response_cache._unpack_response(response_cache._pack_response(response))
+
+    assert restored.body == response.body
+    assert restored.headers["etag"] == '"abc"'
+    assert restored.headers["cache-control"] == "no-cache"
+    assert restored.headers["content-type"] == "application/json"
+    assert restored.headers["content-length"] == str(len(response.body))
+
+
+def test_unpack_rejects_unreadable_entries():
+    assert response_cache._unpack_response(b"no separator") is None
+    assert response_cache._unpack_response(b"not json\n{}") is None
+
+
+async def test_cached_response_serves_hits_without_calling_endpoint(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(response_cache, "get_cache_client", lambda: client)
+    calls = []
+
+    @response_cache.cached_response("assets", expire=60)
+    async def endpoint(request):
+        calls.append(request.url.path)
+        return ORJSONResponse({"n": len(calls)}, headers={"ETag": '"v1"'})
+
+    first = await endpoint(request=_request("/api/v1/stocks", b"b=2&a=1"))
+    second = await endpoint(request=_request("/api/v1/stocks", b"a=1&b=2"))
+
+    assert len(calls) == 1
+    assert list(client.data) == ["cache:assets:/api/v1/stocks?a=1&b=2"]
+    assert second.body == first.body == b'{"n":1}'
+    assert second.headers["etag"] == '"v1"'
+
+
+async def test_cached_response_skips_non_200(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(response_cache, "get_cache_client", lambda: client)
+
+    @response_cache.cached_response("assets", expire=60)
+    async def endpoint(request):
+        return Response(status_code=304)
+
+    await endpoint(request=_request("/api/v1/stocks"))
+
+    assert client.data == {}
+
+
+async def test_cached_response_rejects_streaming_response(monkeypatch):
+    monkeypatch.setattr(response_cache, "get_cache_client", lambda: FakeRedis())
+
+    @response_cache.cached_response("assets", expire=60)
+    async def endpoint(request):
+        return StreamingResponse(iter([b"{}"]))
+
+    with pytest.raises(TypeError, match="StreamingResponse"):
+        await endpoint(request=_request("/api/v1/stocks"))
+
+
+async def test_invalidate_namespace_deletes_only_that_namespace(monkeypatch):
+    client = FakeRedis(
+        {
+            "cache:indices:/api/v1/indices?": b"[]\n{}",
+            "cache:indices:/api/v1/indices?page=2": b"[]\n{}",
+            "cache:indices-extra:/x?": b"[]\n{}",
+            "cache:assets:/api/v1/stocks?": b"[]\n{}",
+        }
+    )
+    monkeypatch.setattr(response_cache.redis, "from_url", lambda url: client)
+
+    removed = await response_cache.invalidate_namespace("indices")
+
+    assert removed == 2
+    assert sorted(client.data) == ["cache:assets:/api/v1/stocks?", "cache:indices-extra:/x?"]
+    assert client.closed
+
+
+async def test_invalidate_namespace_with_no_keys(monkeypatch):
+    client = FakeRedis({"cache:assets:/api/v1/stocks?": b"[]\n{}"})
+    monkeypatch.setattr(response_cache.redis, "from_url", lambda url: client)
+
+    assert await response_cache.invalidate_namespace("indices") == 0
+    assert client.closed
+
+
+def test_pack_response_stores_headers_as_json():
+    packed = response_cache._pack_response(ORJSONResponse([1]))
+    raw_headers, _, body = packed.partition(b"\n")
+
+    assert body == b"[1]"
+    assert ["content-type", "application/json"] in orjson.loads(raw_headers)
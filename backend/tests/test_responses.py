@@ -0,0 +1,64 @@
+"""Tests for app.core.responses."""
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from app.core.responses import ORJSONResponse, _orjson_default, etag_matches
+
+ETAG = '"5f2b9c0d1e3a4b67"'
+
+
+def _request(if_none_match=None):
+    headers = {} if if_none_match is None else {"if-none-match": if_none_match}
+    return SimpleNamespace(headers=headers)
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ("", False),
+        (ETAG, True),
+        ('"0000000000000000"', False),
+        ("*", True),
+        (f"W/{ETAG}", True),
+        (f'"0000000000000000", {ETAG}', True),
+        (f'W/"0000000000000000",W/{ETAG}', True),
+        ('"0000000000000000", "1111111111111111"', False),
+        ("5f2b9c0d1e3a4b67", False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert etag_matches(_request(header), ETAG) is expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (Decimal("42"), 42),
+        (Decimal("1E+2"), 100),
+        (Decimal("-3"), -3),
+        (Decimal("0.125"), 0.125),
+        (Decimal("12.50"), 12.5),
+    ],
+)
+def test_orjson_default_converts_decimal(value, expected):
+    result = _orjson_default(value)
+
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+def test_orjson_default_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        _orjson_default(object())
+
+
+def test_orjson_response_renders_decimals():
+    response = ORJSONResponse({"volume": Decimal("1000"), "close": Decimal("10.25"), 1: "x"})
+
+    assert orjson.loads(response.body) == {"volume": 1000, "close": 10.25, "1": "x"}
+    assert response.body.startswith(b'{"volume":1000,')
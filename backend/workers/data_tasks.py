@@ -21,11 +21,17 @@ from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from sqlalchemy import select, func, text
+from sqlalchemy import select, func, text, update
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 
 from app.config import settings
 from app.core.redis_pubsub import publish_data_sync_event
+from app.core.response_cache import (
+    ASSETS_CACHE_NAMESPACE,
+    MARKET_DATA_GENERATION_KEY,
+    bump_generation,
+    invalidate_namespace,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -192,6 +198,7 @@ async def import_stock_data(ctx: Dict[str, Any], recent_days: int = 1) -> Dict[s
         )
 
         logger.info(f"Stock import completed: {results}")
+        await _invalidate_asset_cache()
         return {"status": "success", "results": results}
 
     except Exception as e:
@@ -240,6 +247,7 @@ async def import_etf_data(ctx: Dict[str, Any], recent_days: int = 1) -> Dict[str
         )
 
         logger.info(f"ETF import completed: {results}")
+        await _invalidate_asset_cache()
         return {"status": "success", "results": results}
 
     except Exception as e:
@@ -323,6 +331,8 @@ async def daily_data_update(ctx: Dict[str, Any]) -> Dict[str, Any]:
     logger.info(f"Daily update completed in {results['duration_seconds']:.1f}s: "
                 f"{successes} successes, {failures} failures")
 
+    await _invalidate_asset_cache()
+
     return results
 
 
@@ -429,10 +439,60 @@ async def get_download_status(ctx: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+async def mark_stale_sync_jobs(ctx: Dict[str, Any]) -> Dict[str, Any]:
+    """Mark sync jobs running longer than the stale threshold as stale.
+
+    Runs as a cron so /data-sync/active stays a read-only query.
+
+    Returns:
+        Number of jobs marked stale
+    """
+    from app.db.models.sync import (
+        SyncHistory,
+        SYNC_STALE_THRESHOLD,
+        SYNC_STALE_THRESHOLD_MINUTES,
+    )
+
+    async with worker_session_maker() as session:
+        result = await session.execute(
+            update(SyncHistory)
+            .where(
+                SyncHistory.status == "running",
+                SyncHistory.started_at < func.now() - SYNC_STALE_THRESHOLD,
+            )
+            .values(
+                status="stale",
+                completed_at=func.now(),
+                error_message=f"Task exceeded {SYNC_STALE_THRESHOLD_MINUTES} minutes timeout - marked as stale",
+            )
+        )
+        await session.commit()
+
+    if result.rowcount:
+        logger.warning(f"Marked {result.rowcount} sync job(s) as stale")
+
+    return {"marked_stale": result.rowcount}
+
+
 # =============================================================================
 # API-triggered Sync Task
 # =============================================================================
 
+async def _invalidate_asset_cache() -> None:
+    """
+    Drop cached /stocks responses and bump the market data generation
+    (part of the /kline ETag) after market data lands.
+    """
+    try:
+        await invalidate_namespace(ASSETS_CACHE_NAMESPACE)
+    except Exception as e:
+        logger.warning(f"Failed to invalidate assets response cache: {e}")
+    try:
+        await bump_generation(MARKET_DATA_GENERATION_KEY)
+    except Exception as e:
+        logger.warning(f"Failed to bump market data generation: {e}")
+
+
 async def _publish_only(event_type: str, job_id: str, data: dict) -> None:
     """Publish SSE event to Redis only (no database persist)."""
     await publish_data_sync_event(event_type, job_id, data)
@@ -888,7 +948,8 @@ async def api_triggered_sync(ctx: Dict[str, Any], sync_record_id: str) -> Dict[s
                 }, session, sync_record)
 
             # Update sync record with success (or partial success if some steps failed)
-            total_duration = (datetime.now() - start_time).total_seconds()
+            end_time = datetime.now()
+            total_duration = (end_time - start_time).total_seconds()
 
             # Determine final status based on step errors
             if step_errors:
@@ -899,7 +960,7 @@ async def api_triggered_sync(ctx: Dict[str, Any], sync_record_id: str) -> Dict[s
                 final_message = f"数据同步完成! 共导入 {records_imported} 条记录"
 
             sync_record.status = final_status
-            sync_record.completed_at = datetime.now()
+            sync_record.completed_at = end_time
             sync_record.duration_seconds = total_duration
             sync_record.records_downloaded = records_imported  # In batch mode, download and import are combined
             sync_record.records_imported = records_imported
@@ -920,6 +981,7 @@ async def api_triggered_sync(ctx: Dict[str, Any], sync_record_id: str) -> Dict[s
             }, session, sync_record)
 
             logger.info(f"API-triggered sync completed ({final_status}): {sync_record_id}")
+            await _invalidate_asset_cache()
             return {
                 "status": final_status,
                 "sync_record_id": sync_record_id,
@@ -958,9 +1020,10 @@ async def api_triggered_sync(ctx: Dict[str, Any], sync_record_id: str) -> Dict[s
                 }, session, sync_record)
 
                 # Update sync record with failure
+                end_time = datetime.now()
                 sync_record.status = "failed"
-                sync_record.completed_at = datetime.now()
-                sync_record.duration_seconds = (datetime.now() - start_time).total_seconds()
+                sync_record.completed_at = end_time
+                sync_record.duration_seconds = (end_time - start_time).total_seconds()
                 sync_record.error_message = str(e)
                 flag_modified(sync_record, "details")
                 await session.commit()
@@ -983,5 +1046,6 @@ __all__ = [
     "daily_data_update",
     "check_data_status",
     "get_download_status",
+    "mark_stale_sync_jobs",
     "api_triggered_sync",
 ]
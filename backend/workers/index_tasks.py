@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.dialects.postgresql import insert
 
 from app.config import settings
+from app.core.response_cache import INDICES_CACHE_NAMESPACE, invalidate_namespace
 from app.db.models.stock_pool import IndexConstituent
 from app.db.models.profile import StockProfile, IndexProfile
 
@@ -103,6 +104,16 @@ async def calculate_index_industry_composition(
 
         await db.commit()
 
+        # Rebuild the flattened SW L1 weights read by /indices/by-industry
+        await db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY index_industry_sw_l1"))
+        await db.commit()
+
+        # Drop cached /indices responses built from the old compositions
+        try:
+            await invalidate_namespace(INDICES_CACHE_NAMESPACE)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate indices response cache: {e}")
+
         return {
             "task": "calculate_index_industry_composition",
             "calc_date": str(target_date),
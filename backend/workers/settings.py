@@ -21,6 +21,7 @@ from workers.data_tasks import (
     daily_data_update,
     check_data_status,
     get_download_status,
+    mark_stale_sync_jobs,
     api_triggered_sync,
 )
 from workers.index_tasks import (
@@ -66,6 +67,7 @@ class WorkerSettings:
         daily_data_update,
         check_data_status,
         get_download_status,
+        mark_stale_sync_jobs,
         # api_triggered_sync has 60min timeout for historical backfill
         func(api_triggered_sync, timeout=3600),
         # Index tasks
@@ -81,6 +83,8 @@ class WorkerSettings:
         # Weekly index composition update on Sunday at 22:00 CST (14:00 UTC)
         # Updates industry weights based on current constituent stocks
         cron(daily_index_update, weekday=6, hour=14, minute=0),
+        # Every minute: mark sync jobs stuck in "running" as stale
+        cron(mark_stale_sync_jobs),
     ]
 
     # Worker settings